@@ -0,0 +1,6 @@
+from ._runs import add_compare_parser
+from ._runs import compare_runs
+from ._runs import platform_info
+from ._runs import print_regressions
+from ._runs import read_json
+from ._runs import write_json
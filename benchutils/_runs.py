@@ -0,0 +1,122 @@
+"""
+Saving benchmark runs and flagging regressions between two of them.
+
+A run is a list of dataclass records, one per measured configuration.
+write_json stores it with the versions of the libraries it was measured
+with, read_json loads it back, and compare_runs matches the records of
+two runs on their key fields and reports the metrics that grew by more
+than a threshold. The compare helpers build the matching command of the
+pw command-line interfaces.
+"""
+import json
+import math
+import platform
+from dataclasses import asdict
+
+import numpy as np
+
+
+def platform_info(**versions) -> dict:
+    """
+    Python, numpy and machine of this run, plus the given library versions.
+    """
+    return {"python": platform.python_version(), "numpy": np.__version__, **versions,
+            "machine": platform.machine()}
+
+
+def write_json(records: list, path: str, versions: dict | None = None, **extra) -> None:
+    """
+    Save dataclass records and the platform they were measured on.
+
+    Parameters:
+    records (list): Dataclass records of the run.
+    path (str): Destination JSON file, overwritten.
+    versions (dict | None): Extra library versions, e.g. {"scipy": scipy.__version__}.
+    **extra: Further top-level entries, e.g. fitted slopes.
+    """
+    run = {
+        "platform": platform_info(**(versions or {})),
+        "records": [asdict(record) for record in records],
+        **extra,
+    }
+    with open(path, "w") as f:
+        json.dump(run, f, indent=2)
+
+
+def read_json(path: str, record_type: type) -> list:
+    """
+    Load the records saved by write_json as instances of record_type.
+    """
+    with open(path) as f:
+        run = json.load(f)
+    return [record_type(**record) for record in run["records"]]
+
+
+def compare_runs(baseline: list, current: list, key: tuple, metrics: tuple, threshold: float = 0.10,
+                 floors: dict | None = None) -> list:
+    """
+    Flag the measurements of current that got worse than baseline.
+
+    The records of both runs are matched on their key fields; a metric
+    regresses when it grows by more than the threshold fraction. A metric
+    with a floor is not compared while both values are below it, so errors
+    at the level of rounding do not count.
+
+    Parameters:
+    baseline (list): Reference run.
+    current (list): New run.
+    key (tuple[str, ...]): Fields identifying a configuration.
+    metrics (tuple[str, ...]): Fields where larger is worse.
+    threshold (float): Tolerated relative increase.
+    floors (dict[str, float] | None): Metric -> value below which it is not compared.
+
+    Returns:
+    list[dict]: One entry per regression with the key fields, metric, both values and their ratio.
+    """
+    floors = floors or {}
+
+    def identify(record) -> tuple:
+        return tuple(getattr(record, field) for field in key)
+
+    reference = {identify(record): record for record in baseline}
+    regressions = []
+    for record in current:
+        old = reference.get(identify(record))
+        if old is None:
+            continue
+        for metric in metrics:
+            before, after = getattr(old, metric), getattr(record, metric)
+            if max(before, after) < floors.get(metric, -math.inf):
+                continue
+            if after > before * (1 + threshold) and after > 0:
+                ratio = after / before if before else math.inf
+                regressions.append({**dict(zip(key, identify(record))), "metric": metric,
+                                    "baseline": before, "current": after, "ratio": ratio})
+    return regressions
+
+
+def add_compare_parser(commands) -> None:
+    """
+    Add the 'compare baseline current --threshold' command to argparse subparsers.
+    """
+    compare = commands.add_parser("compare", help="flag regressions between two JSON runs")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument("--threshold", type=float, default=0.10,
+                         help="tolerated relative increase (default: 0.10)")
+
+
+def print_regressions(regressions: list, key: tuple) -> int:
+    """
+    Print one line per regression.
+
+    Returns:
+    int: Exit status, 1 if anything regressed and 0 otherwise.
+    """
+    for regression in regressions:
+        fields = " | ".join(f"{field}={regression[field]}" for field in key)
+        print(f"{fields} | {regression['metric']:>15} | {regression['baseline']:.4g} -> "
+              f"{regression['current']:.4g} (x{regression['ratio']:.2f})")
+    if not regressions:
+        print("No regressions.")
+    return 1 if regressions else 0
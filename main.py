@@ -16,7 +16,9 @@ from pw1 import EulerMethod
 # Pw 1
 
 TrapezoidalMethod(100000).trapezoidal_example()
+TrapezoidalMethod(100000).quadrature_example()
 StochasticMethod(100000).stochastic_example()   
+StochasticMethod(100000).run_until_example()
 EulerMethod(100000).euler_example()  
 
 # Pw 2
@@ -0,0 +1,4 @@
+from ._decimate import decimate
+from ._decimate import lttb
+from ._decimate import minmax_decimate
+from ._decimate import plot_decimated
@@ -0,0 +1,145 @@
+"""
+Decimation of long series before plotting.
+
+A line plot can never show more than a couple of values per horizontal
+pixel, so drawing millions of points only costs rendering time and file
+size. The reducers below keep the visual shape of a series with a number
+of points that depends on the width of the axes, not on the data:
+
+* min/max per pixel keeps the extreme values of every pixel column (bins
+  of equal x width), so spikes and the envelope of noise look exactly
+  the same;
+* LTTB (Largest Triangle Three Buckets) keeps, per bucket, the point that
+  forms the largest triangle with its neighbours, which follows the shape
+  of smooth curves and scatter plots with few points.
+"""
+import numpy as np
+import matplotlib.pyplot as plt
+
+
+def minmax_decimate(x, y, n_bins: int) -> tuple:
+    """
+    Keep the minimum and the maximum of y in each of n_bins bins of equal x width.
+
+    The bins split the x range like the pixel columns of the axes, so
+    unevenly sampled series are reduced per pixel too. The points are kept
+    in their original order, along with the first and last points, so
+    lines drawn through them keep the envelope of the data.
+
+    Parameters:
+    x (np.ndarray): Abscissae, non-decreasing; use plt.plot for parametric curves.
+    y (np.ndarray): Ordinates.
+    n_bins (int): Number of bins, usually the width of the axes in pixels.
+
+    Returns:
+    tuple[np.ndarray, np.ndarray]: At most 2 * n_bins + 2 points.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=float)
+    n = y.size
+    if n <= 2 * n_bins + 2:
+        return x, y
+    xf = x.astype(float)
+    if np.any(xf[1:] < xf[:-1]):
+        raise ValueError("x must be non-decreasing, plot parametric curves with plt.plot")
+    edges = np.linspace(xf[0], xf[-1], n_bins + 1)
+    # First point of every non-empty bin, and the bin of every point.
+    starts = np.unique(np.searchsorted(xf, edges[:-1]))
+    bins = np.repeat(np.arange(starts.size), np.diff(np.append(starts, n)))
+    keep = [[0, n - 1]]
+    for extremes in (np.minimum.reduceat(y, starts), np.maximum.reduceat(y, starts)):
+        hits = np.flatnonzero(y == extremes[bins])
+        # The first point reaching each extreme.
+        _, first = np.unique(bins[hits], return_index=True)
+        keep.append(hits[first])
+    keep = np.unique(np.concatenate(keep))
+    return x[keep], y[keep]
+
+
+def lttb(x, y, n_out: int) -> tuple:
+    """
+    Largest Triangle Three Buckets downsampling.
+
+    The first and last points are kept; the others are split into
+    n_out - 2 buckets and each bucket keeps the point forming the largest
+    triangle with the point kept in the previous bucket and the mean of
+    the next bucket. The loop runs over buckets, each bucket is handled
+    with vectorized NumPy operations.
+
+    Parameters:
+    x (np.ndarray): Abscissae, ordered.
+    y (np.ndarray): Ordinates.
+    n_out (int): Number of points to keep, at least 3.
+
+    Returns:
+    tuple[np.ndarray, np.ndarray]: n_out points.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=float)
+    n = y.size
+    if n_out >= n or n_out < 3:
+        return x, y
+    xf = x.astype(float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    keep = np.empty(n_out, dtype=int)
+    keep[0] = 0
+    keep[-1] = n - 1
+    previous = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < n_out - 1:
+            next_x = xf[hi:edges[i + 2]].mean()
+            next_y = y[hi:edges[i + 2]].mean()
+        else:
+            next_x, next_y = xf[-1], y[-1]
+        area = np.abs((xf[previous] - next_x) * (y[lo:hi] - y[previous])
+                      - (xf[previous] - xf[lo:hi]) * (next_y - y[previous]))
+        previous = lo + int(np.argmax(area))
+        keep[i + 1] = previous
+    return x[keep], y[keep]
+
+
+METHODS = {
+    "minmax": lambda x, y, n_out: minmax_decimate(x, y, max(1, n_out // 2)),
+    "lttb": lttb,
+}
+
+
+def decimate(x, y, n_out: int, method: str = "minmax") -> tuple:
+    """
+    Reduce a series to about n_out points with one of the methods in METHODS.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown decimation method {method!r}, expected one of {sorted(METHODS)}")
+    return METHODS[method](x, y, n_out)
+
+
+def axes_pixels(ax) -> int:
+    """
+    Width of the axes in display pixels.
+    """
+    return max(1, int(ax.get_window_extent().width))
+
+
+def plot_decimated(x, y, *args, ax=None, method: str = "minmax", n_out: int | None = None, **kwargs):
+    """
+    Drop-in replacement for plt.plot(x, y, ...) that decimates long series first.
+
+    By default the series is reduced to two points per horizontal pixel of
+    the axes (min/max per pixel), so the time spent drawing does not grow
+    with the length of the data.
+
+    Parameters:
+    x, y (np.ndarray): Series to plot.
+    *args: Format string and other positional arguments of plt.plot.
+    ax (matplotlib.axes.Axes | None): Axes to draw on, the current axes if None.
+    method (str): "minmax" or "lttb".
+    n_out (int | None): Number of points to keep, two per pixel if None.
+    **kwargs: Keyword arguments of plt.plot.
+
+    Returns:
+    list[matplotlib.lines.Line2D]: The plotted lines.
+    """
+    ax = ax or plt.gca()
+    n_out = n_out or 2 * axes_pixels(ax)
+    return ax.plot(*decimate(x, y, n_out, method), *args, **kwargs)
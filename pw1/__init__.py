@@ -1,3 +1,20 @@
 from ._pw1 import TrapezoidalMethod
 from ._pw1 import StochasticMethod
-from ._pw1 import EulerMethod
\ No newline at end of file
+from ._pw1 import EulerMethod
+from ._montecarlo import MonteCarloEngine
+from ._montecarlo import ParallelHits
+from ._montecarlo import parallel_count_hits
+from ._montecarlo import QMCResult
+from ._montecarlo import qmc_estimate
+from ._montecarlo import RunningEstimate
+from ._quadrature import QuadratureResult
+from ._quadrature import integrate
+from ._quadrature import TrapezoidalSweep
+from ._series import CompensatedSum
+from ._series import euler_partial_sums
+from ._parallel import ChunkScheduler
+from ._profiler import ProfileRecord
+from ._profiler import profile
+from ._profiler import compare_runs
+from ._quadrature import BatchQuadratureResult
+from ._quadrature import integrate_batch
@@ -0,0 +1,54 @@
+"""
+Profile the π estimators of pw1 and compare profiling runs.
+
+Usage:
+    python -m pw1 profile --json run.json --csv run.csv
+    python -m pw1 compare baseline.json run.json --threshold 0.1
+"""
+import argparse
+import sys
+
+from benchutils import add_compare_parser, print_regressions
+
+from ._profiler import (DEFAULT_N_VALUES, KEY, compare_runs, default_estimators, print_records,
+                        profile, read_json, write_csv, write_json)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m pw1", description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("profile", help="profile the estimators")
+    run.add_argument("--N", type=int, nargs="+", default=DEFAULT_N_VALUES, help="size parameters")
+    run.add_argument("--methods", nargs="+", help="estimators to profile (default: all)")
+    run.add_argument("--warmups", type=int, default=1)
+    run.add_argument("--repeats", type=int, default=5)
+    run.add_argument("--seed", type=int, default=0, help="seed of the stochastic estimators")
+    run.add_argument("--json", help="write the records and slopes to this JSON file")
+    run.add_argument("--csv", help="write the records to this CSV file")
+
+    add_compare_parser(commands)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "profile":
+        estimators = default_estimators(args.seed)
+        if args.methods:
+            unknown = set(args.methods) - set(estimators)
+            if unknown:
+                parser.error(f"unknown methods {sorted(unknown)}, expected some of {sorted(estimators)}")
+            estimators = {name: estimators[name] for name in args.methods}
+        records = profile(estimators, args.N, args.warmups, args.repeats)
+        print_records(records)
+        if args.json:
+            write_json(records, args.json)
+        if args.csv:
+            write_csv(records, args.csv)
+        return 0
+
+    regressions = compare_runs(read_json(args.baseline), read_json(args.current), args.threshold)
+    return print_regressions(regressions, KEY)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,386 @@
+import math
+import os
+import time
+from statistics import NormalDist
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+from scipy.stats import qmc
+
+
+# Number of points drawn per block; two float64 coordinates per point
+# keep the working buffer at 16 MB whatever the total sample count is.
+DEFAULT_BLOCK_SIZE = 1_000_000
+
+# Sobol points keep their balance properties only in runs of powers of two,
+# so the quasi-Monte Carlo blocks use the nearest power of two instead.
+QMC_BLOCK_SIZE = 2 ** 20
+
+QMC_SAMPLERS = {
+    "sobol": qmc.Sobol,
+    "halton": qmc.Halton,
+}
+
+
+def count_hits(rng: np.random.Generator, N: int, block_size: int = DEFAULT_BLOCK_SIZE) -> int:
+    """
+    Count how many of N uniform points in the unit square fall inside the unit circle.
+
+    The points are drawn in blocks of at most block_size into a single
+    preallocated buffer, so memory use does not depend on N. Sampling the
+    quarter disc in [0, 1)^2 is equivalent to sampling the full disc in
+    [-1, 1]^2 by symmetry.
+
+    Parameters:
+    rng (np.random.Generator): Source of random numbers.
+    N (int): Number of points to draw.
+    block_size (int): Maximum number of points drawn at once.
+
+    Returns:
+    int: Number of points with x**2 + y**2 <= 1.
+    """
+    if N < 0:
+        raise ValueError("N must be non-negative")
+    if block_size <= 0:
+        raise ValueError("block_size must be positive")
+
+    capacity = min(block_size, max(N, 1))
+    buffer = np.empty(2 * capacity)
+    hits = 0
+    remaining = N
+    while remaining > 0:
+        m = min(remaining, capacity)
+        block = buffer[:2 * m].reshape(2, m)
+        rng.random(out=block)
+        np.square(block, out=block)
+        np.add(block[0], block[1], out=block[0])
+        hits += int(np.count_nonzero(block[0] <= 1.0))
+        remaining -= m
+    return hits
+
+
+@dataclass
+class RunningEstimate:
+    """
+    State of a streaming Monte Carlo run after a block of points.
+
+    Attributes:
+    samples (int): Number of points drawn so far.
+    hits (int): Number of those points inside the circle.
+    estimate (float): Current estimate of π.
+    stderr (float): Standard error of the estimate.
+    ci_low, ci_high (float): Bounds of the confidence interval.
+    elapsed (float): Seconds since the stream started.
+    """
+    samples: int
+    hits: int
+    estimate: float
+    stderr: float
+    ci_low: float
+    ci_high: float
+    elapsed: float
+
+    @property
+    def rel_half_width(self) -> float:
+        """
+        Half-width of the confidence interval relative to the estimate.
+        """
+        if self.estimate == 0:
+            return math.inf
+        return (self.ci_high - self.ci_low) / (2 * self.estimate)
+
+
+class MonteCarloEngine:
+
+    def __init__(self, seed=None, block_size: int = DEFAULT_BLOCK_SIZE) -> None:
+        """
+        Block-wise Monte Carlo estimator of π.
+
+        Parameters:
+        seed (int | np.random.SeedSequence | None): Seed of the random stream.
+            None draws fresh entropy from the operating system.
+        block_size (int): Maximum number of points drawn at once.
+        """
+        self.seed = seed
+        self.block_size = block_size
+        self.rng = np.random.default_rng(seed)
+
+    def count_hits(self, N: int) -> int:
+        """
+        Draw N points from the engine's stream and count those inside the circle.
+        """
+        return count_hits(self.rng, N, self.block_size)
+
+    def estimate(self, N: int) -> float:
+        """
+        Estimate π from N random points.
+
+        Parameters:
+        N (int): Number of points to draw.
+
+        Returns:
+        float: Estimated value of π.
+        """
+        if N <= 0:
+            raise ValueError("N must be positive")
+        return 4 * self.count_hits(N) / N
+
+    def stream(self, confidence: float = 0.95, max_samples: int | None = None):
+        """
+        Draw blocks of points forever and yield the running estimate after each one.
+
+        The confidence interval uses the normal approximation of the binomial
+        hit count, which is accurate once a block of points has been drawn.
+
+        Parameters:
+        confidence (float): Confidence level of the interval.
+        max_samples (int | None): Stop after this many points, never stop if None.
+
+        Yields:
+        RunningEstimate: Estimate, standard error and interval after each block.
+        """
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        start = time.perf_counter()
+        samples = 0
+        hits = 0
+        while max_samples is None or samples < max_samples:
+            n = self.block_size
+            if max_samples is not None:
+                n = min(n, max_samples - samples)
+            hits += self.count_hits(n)
+            samples += n
+            p = hits / samples
+            estimate = 4 * p
+            stderr = 4 * math.sqrt(p * (1 - p) / samples)
+            yield RunningEstimate(samples, hits, estimate, stderr,
+                                  estimate - z * stderr, estimate + z * stderr,
+                                  time.perf_counter() - start)
+
+    def run_until(self, rel_tol: float, max_samples: int | None = None,
+                  max_seconds: float | None = None, confidence: float = 0.95) -> RunningEstimate:
+        """
+        Draw blocks of points until the confidence interval is tight enough.
+
+        The run stops as soon as the half-width of the interval is below
+        rel_tol times the estimate, or when one of the budgets runs out.
+
+        Parameters:
+        rel_tol (float): Target relative half-width of the confidence interval.
+        max_samples (int | None): Maximum number of points.
+        max_seconds (float | None): Maximum wall-clock time.
+        confidence (float): Confidence level of the interval.
+
+        Returns:
+        RunningEstimate: State of the run when it stopped.
+        """
+        if max_samples is not None and max_samples <= 0:
+            raise ValueError("max_samples must be positive")
+        for current in self.stream(confidence, max_samples):
+            # A block made only of hits (or misses) has a zero standard error
+            # that says nothing about the precision, so keep drawing.
+            converged = 0 < current.hits < current.samples and current.rel_half_width <= rel_tol
+            if converged or (max_seconds is not None and current.elapsed >= max_seconds):
+                break
+        return current
+
+
+@dataclass
+class ParallelHits:
+    """
+    Hit counts of a parallel Monte Carlo run, kept per worker so runs can be merged.
+
+    Attributes:
+    samples_per_worker (list[int]): Number of points drawn by each worker.
+    hits_per_worker (list[int]): Number of points inside the circle for each worker.
+    """
+    samples_per_worker: list
+    hits_per_worker: list
+
+    @property
+    def samples(self) -> int:
+        return sum(self.samples_per_worker)
+
+    @property
+    def hits(self) -> int:
+        return sum(self.hits_per_worker)
+
+    @property
+    def estimate(self) -> float:
+        return 4 * self.hits / self.samples
+
+    def merge(self, other: "ParallelHits") -> "ParallelHits":
+        """
+        Combine two runs into one; the workers of both runs are kept side by side.
+        """
+        return ParallelHits(self.samples_per_worker + other.samples_per_worker,
+                            self.hits_per_worker + other.hits_per_worker)
+
+
+def _block_sizes(N: int, block_size: int, first: int, last: int) -> list:
+    return [min(block_size, N - i * block_size) for i in range(first, last)]
+
+
+def _count_block_range(entropy, spawn_key: tuple, N: int, block_size: int,
+                       first: int, last: int) -> int:
+    """
+    Count the hits of blocks first..last-1, each drawn from its own child stream.
+
+    The child for block i is the same SeedSequence that SeedSequence.spawn
+    would have returned at position i, rebuilt here so that only a few
+    integers need to be sent to the worker process.
+    """
+    hits = 0
+    for i, n in zip(range(first, last), _block_sizes(N, block_size, first, last)):
+        child = np.random.SeedSequence(entropy, spawn_key=spawn_key + (i,))
+        hits += count_hits(np.random.default_rng(child), n, block_size)
+    return hits
+
+
+def parallel_count_hits(N: int, seed=None, workers: int | None = None,
+                        block_size: int = DEFAULT_BLOCK_SIZE) -> ParallelHits:
+    """
+    Count the hits of N random points with blocks spread over a process pool.
+
+    Every block of block_size points gets its own SeedSequence.spawn child of
+    the root seed, and the blocks are split into contiguous ranges, one per
+    worker. Since the random stream of each block only depends on its index,
+    the total hit count (and the estimate of π) is identical for a given seed
+    and block size whatever the number of workers.
+
+    Parameters:
+    N (int): Number of points to draw.
+    seed (int | np.random.SeedSequence | None): Root seed of the run.
+    workers (int | None): Number of processes, defaults to os.cpu_count().
+    block_size (int): Number of points per block.
+
+    Returns:
+    ParallelHits: Samples and hit counts of each worker.
+    """
+    if N <= 0:
+        raise ValueError("N must be positive")
+    if block_size <= 0:
+        raise ValueError("block_size must be positive")
+    workers = workers or os.cpu_count() or 1
+
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    n_blocks = -(-N // block_size)
+    workers = max(1, min(workers, n_blocks))
+    bounds = np.linspace(0, n_blocks, workers + 1).astype(int)
+    ranges = list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+    samples = [sum(_block_sizes(N, block_size, first, last)) for first, last in ranges]
+
+    if workers == 1:
+        hits = [_count_block_range(root.entropy, root.spawn_key, N, block_size, 0, n_blocks)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_count_block_range, root.entropy, root.spawn_key,
+                                       N, block_size, first, last)
+                       for first, last in ranges]
+            hits = [future.result() for future in futures]
+    return ParallelHits(samples, hits)
+
+
+@dataclass
+class QMCResult:
+    """
+    Randomized quasi-Monte Carlo estimate of π.
+
+    Attributes:
+    estimates (list[float]): Estimate of each independently scrambled replicate.
+    samples (int): Total number of points over all replicates.
+    """
+    estimates: list
+    samples: int
+
+    @property
+    def estimate(self) -> float:
+        return float(np.mean(self.estimates))
+
+    @property
+    def stderr(self) -> float:
+        """
+        Standard error of the mean over replicates, nan for a single replicate.
+        """
+        if len(self.estimates) < 2:
+            return math.nan
+        return float(np.std(self.estimates, ddof=1) / math.sqrt(len(self.estimates)))
+
+
+def _qmc_count_hits(sampler, n: int, block_size: int) -> int:
+    hits = 0
+    remaining = n
+    while remaining > 0:
+        m = min(remaining, block_size)
+        points = sampler.random(m)
+        np.square(points, out=points)
+        hits += int(np.count_nonzero(points.sum(axis=1) <= 1.0))
+        remaining -= m
+    return hits
+
+
+def qmc_estimate(N: int, kind: str = "sobol", replicates: int = 8, seed=None,
+                 block_size: int = QMC_BLOCK_SIZE) -> QMCResult:
+    """
+    Estimate π with scrambled low-discrepancy points.
+
+    The N points are split over independently scrambled replicates; the
+    spread of the replicate estimates gives the error bar. For Sobol points
+    the size of each replicate is rounded up to a power of two.
+
+    Parameters:
+    N (int): Total number of points.
+    kind (str): "sobol" or "halton".
+    replicates (int): Number of independent scramblings.
+    seed (int | np.random.SeedSequence | None): Seed of the scramblings.
+    block_size (int): Maximum number of points drawn at once, a power of two.
+
+    Returns:
+    QMCResult: Estimates of every replicate.
+    """
+    if kind not in QMC_SAMPLERS:
+        raise ValueError(f"Unknown QMC sampler {kind!r}, expected one of {sorted(QMC_SAMPLERS)}")
+    if N <= 0 or replicates <= 0:
+        raise ValueError("N and replicates must be positive")
+
+    n = max(1, -(-N // replicates))
+    if kind == "sobol":
+        n = 1 << (n - 1).bit_length()
+
+    root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    estimates = []
+    for child in root.spawn(replicates):
+        sampler = QMC_SAMPLERS[kind](2, scramble=True, seed=np.random.default_rng(child))
+        estimates.append(4 * _qmc_count_hits(sampler, n, block_size) / n)
+    return QMCResult(estimates, n * replicates)
+
+
+def qmc_samples_to_reach(rel_error: float, kind: str = "sobol", replicates: int = 8,
+                         seed=None, max_samples: int = 2 ** 24) -> int | None:
+    """
+    Find how many quasi-Monte Carlo points are needed to reach an expected relative error.
+
+    The number of points is doubled until the standard error of the
+    replicate mean is at most rel_error * π. The standard error measures
+    the expected error of the estimate rather than the luck of a single
+    one, so the answer grows steadily as rel_error shrinks.
+
+    Parameters:
+    rel_error (float): Target relative error.
+    kind (str): "sobol" or "halton".
+    replicates (int): Number of independent scramblings.
+    seed (int | np.random.SeedSequence | None): Seed of the scramblings.
+    max_samples (int): Largest number of points tried.
+
+    Returns:
+    int | None: Total number of points used, or None if max_samples was not enough.
+    """
+    if replicates < 2:
+        raise ValueError("replicates must be at least 2 to estimate the error")
+    N = 2 * replicates
+    while N <= max_samples:
+        result = qmc_estimate(N, kind, replicates, seed)
+        if result.stderr <= rel_error * math.pi:
+            return result.samples
+        N *= 2
+    return None
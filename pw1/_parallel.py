@@ -0,0 +1,110 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from ._series import CompensatedSum, reciprocal_squares_sum
+
+
+# Chunks small enough to stay in cache, large enough for NumPy to release
+# the GIL for most of the work.
+DEFAULT_CHUNK_SIZE = 1 << 18
+
+
+class ChunkScheduler:
+
+    def __init__(self, workers: int | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """
+        Split an index range into chunks and reduce them on a thread pool.
+
+        NumPy ufuncs release the GIL, so threads give real parallelism on the
+        vectorized kernels without the start-up cost of processes. Every
+        thread owns one scratch buffer allocated before the run, and the
+        partial sums are reduced in chunk order with compensation, so the
+        result does not depend on the number of threads.
+
+        Parameters:
+        workers (int | None): Number of threads, defaults to os.cpu_count().
+        chunk_size (int): Number of indices per chunk.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+
+    def map_reduce(self, kernel, first: int, last: int, make_scratch) -> float:
+        """
+        Sum kernel(lo, hi, scratch) over the chunks [lo, hi) of [first, last).
+
+        Parameters:
+        kernel (callable): Returns the partial sum of one chunk.
+        first, last (int): Index range.
+        make_scratch (callable): Builds the scratch buffers of one thread from the chunk size.
+
+        Returns:
+        float: Sum of all partial sums.
+        """
+        if last <= first:
+            return 0.0
+        bounds = list(range(first, last, self.chunk_size)) + [last]
+        n_chunks = len(bounds) - 1
+        partials = [0.0] * n_chunks
+        workers = min(self.workers, n_chunks)
+        size = min(self.chunk_size, last - first)
+
+        def run(worker: int) -> None:
+            scratch = make_scratch(size)
+            for i in range(worker, n_chunks, workers):
+                partials[i] = kernel(bounds[i], bounds[i + 1], scratch)
+
+        if workers == 1:
+            run(0)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for future in [executor.submit(run, w) for w in range(workers)]:
+                    future.result()
+
+        total = CompensatedSum()
+        for partial in partials:
+            total.add(partial)
+        return total.value
+
+
+def _index_scratch(size: int) -> tuple:
+    return np.arange(size, dtype=float), np.empty(size)
+
+
+def reciprocal_squares_sum_threaded(N: int, scheduler: ChunkScheduler) -> float:
+    """
+    Sum 1 / k**2 for k = 1, ..., N on the scheduler's threads.
+    """
+    def kernel(lo: int, hi: int, scratch: tuple) -> float:
+        return reciprocal_squares_sum(lo, hi, *scratch)
+
+    return scheduler.map_reduce(kernel, 1, N + 1, _index_scratch)
+
+
+def grid_sum_threaded(f_inplace, start: float, step: float, count: int,
+                      scheduler: ChunkScheduler) -> float:
+    """
+    Sum f(start + k * step) for k = 0, ..., count - 1 on the scheduler's threads.
+
+    Parameters:
+    f_inplace (callable): Vectorized integrand called as f_inplace(x, out=x).
+    start (float): First abscissa.
+    step (float): Spacing of the abscissae.
+    count (int): Number of abscissae.
+    scheduler (ChunkScheduler): Thread pool and chunking.
+
+    Returns:
+    float: Sum of the integrand over the grid.
+    """
+    def kernel(lo: int, hi: int, scratch: tuple) -> float:
+        base, x = scratch
+        x = x[:hi - lo]
+        np.add(base[:hi - lo], lo, out=x)
+        x *= step
+        x += start
+        return float(np.sum(f_inplace(x, out=x)))
+
+    return scheduler.map_reduce(kernel, 0, count, _index_scratch)
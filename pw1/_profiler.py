@@ -0,0 +1,204 @@
+import csv
+import math
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, fields
+
+import numpy as np
+
+import benchutils
+
+from ._montecarlo import qmc_estimate
+from ._pw1 import EulerMethod, StochasticMethod, TrapezoidalMethod
+
+
+DEFAULT_N_VALUES = [10, 100, 1000, 10000, 100000, 1000000]
+
+# Fields identifying a record, and the metrics compared between runs.
+KEY = ("method", "N")
+METRICS = ("time_ns_median", "peak_bytes", "relative_error")
+
+
+@dataclass
+class ProfileRecord:
+    """
+    Cost and accuracy of one estimator at one N.
+
+    Attributes:
+    method (str): Name of the estimator.
+    N (int): Size parameter passed to the estimator.
+    nfev (int): Number of function evaluations (points, terms or abscissae).
+    repeats (int): Number of timed runs.
+    time_ns_min (int): Fastest run in nanoseconds.
+    time_ns_median (int): Median run in nanoseconds.
+    peak_bytes (int): Peak memory allocated during one run, from tracemalloc.
+    estimate (float): Estimated value of π.
+    relative_error (float): |estimate - π| / π.
+    """
+    method: str
+    N: int
+    nfev: int
+    repeats: int
+    time_ns_min: int
+    time_ns_median: int
+    peak_bytes: int
+    estimate: float
+    relative_error: float
+
+
+def default_estimators(seed: int = 0) -> dict:
+    """
+    The π estimators of pw1, each as a callable N -> (estimate, nfev).
+
+    The stochastic estimators are reseeded on every call, so repeated runs
+    time the same work and give the same error.
+    """
+    trapezoidal = TrapezoidalMethod(0)
+    euler = EulerMethod(0)
+    return {
+        "trapezoid": lambda N: (trapezoidal.trapezoidal_pi(N), N + 1),
+        "gauss_kronrod": lambda N: _result_pair(trapezoidal.quadrature_pi("gauss_kronrod", tol=1 / N)),
+        "stochastic": lambda N: (StochasticMethod(N, seed).stochastic_pi(N), N),
+        # Sobol replicates are rounded up to a power of two, so N undercounts the points.
+        "quasi_stochastic": lambda N: _qmc_pair(qmc_estimate(N, seed=seed)),
+        "euler": lambda N: (euler.calc_pi_by_euler_numpy(N), N),
+        "euler_chunked": lambda N: (euler.calc_pi_by_euler_chunked(N), N),
+    }
+
+
+def _result_pair(result) -> tuple:
+    return result.value, result.nfev
+
+
+def _qmc_pair(result) -> tuple:
+    return result.estimate, result.samples
+
+
+def profile_estimator(method: str, estimator, N: int, warmups: int = 1,
+                      repeats: int = 5) -> ProfileRecord:
+    """
+    Time an estimator with warm-ups and repeats, then measure its peak memory.
+
+    The memory run is separate because tracemalloc slows down allocation.
+
+    Parameters:
+    method (str): Name of the estimator.
+    estimator (callable): N -> (estimate, nfev).
+    N (int): Size parameter.
+    warmups (int): Untimed runs before the timed ones.
+    repeats (int): Number of timed runs.
+
+    Returns:
+    ProfileRecord: Timings, memory and error of the estimator.
+    """
+    for _ in range(warmups):
+        estimator(N)
+
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        estimate, nfev = estimator(N)
+        times.append(time.perf_counter_ns() - start)
+
+    tracemalloc.start()
+    try:
+        estimator(N)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return ProfileRecord(method, N, int(nfev), repeats, min(times), int(statistics.median(times)),
+                         peak, float(estimate), abs(estimate - math.pi) / math.pi)
+
+
+def profile(estimators: dict | None = None, N_values=DEFAULT_N_VALUES, warmups: int = 1,
+            repeats: int = 5) -> list:
+    """
+    Profile every estimator at every N.
+
+    Parameters:
+    estimators (dict | None): Name -> callable, defaults to default_estimators().
+    N_values (iterable of int): Size parameters.
+    warmups (int): Untimed runs before the timed ones.
+    repeats (int): Number of timed runs.
+
+    Returns:
+    list[ProfileRecord]: One record per estimator and N.
+    """
+    estimators = estimators or default_estimators()
+    return [profile_estimator(method, estimator, N, warmups, repeats)
+            for method, estimator in estimators.items() for N in N_values]
+
+
+def fit_slopes(records: list) -> dict:
+    """
+    Fit log10(relative error) against log10(median time) for each method.
+
+    A slope of -1 means every tenfold increase of run time buys one more
+    digit of accuracy. Methods with fewer than two non-zero errors get nan.
+
+    Returns:
+    dict[str, float]: Slope of the error-versus-time line for each method.
+    """
+    slopes = {}
+    for method in dict.fromkeys(record.method for record in records):
+        points = [(record.time_ns_median, record.relative_error) for record in records
+                  if record.method == method and record.relative_error > 0]
+        if len(points) < 2:
+            slopes[method] = math.nan
+            continue
+        log_time, log_error = np.log10(np.array(points, dtype=float)).T
+        slopes[method] = float(np.polyfit(log_time, log_error, 1)[0])
+    return slopes
+
+
+def write_json(records: list, path: str) -> None:
+    """
+    Save the records, their slopes and the platform they were measured on.
+    """
+    benchutils.write_json(records, path, slopes=fit_slopes(records))
+
+
+def read_json(path: str) -> list:
+    """
+    Load the records saved by write_json.
+    """
+    return benchutils.read_json(path, ProfileRecord)
+
+
+def write_csv(records: list, path: str) -> None:
+    """
+    Save the records as a CSV table, one row per estimator and N.
+    """
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=[field.name for field in fields(ProfileRecord)])
+        writer.writeheader()
+        for record in records:
+            writer.writerow(asdict(record))
+
+
+def compare_runs(baseline: list, current: list, threshold: float = 0.10) -> list:
+    """
+    Flag the measurements of current that got worse than baseline.
+
+    The METRICS of every (method, N) present in both runs are compared with
+    benchutils.compare_runs; relative errors below 1e-14 are rounding and
+    are not compared.
+
+    Returns:
+    list[dict]: One entry per regression with method, N, metric, both values and their ratio.
+    """
+    return benchutils.compare_runs(baseline, current, KEY, METRICS, threshold, {"relative_error": 1e-14})
+
+
+def print_records(records: list) -> None:
+    print(f"{'Method':>16} | {'N':>8} | {'nfev':>8} | {'Median (ms)':>11} | {'Peak (KiB)':>10} | {'Relative Error':>15}")
+    print("-" * 85)
+    for record in records:
+        print(f"{record.method:>16} | {record.N:>8} | {record.nfev:>8} | {record.time_ns_median / 1e6:>11.4f} | "
+              f"{record.peak_bytes / 1024:>10.1f} | {record.relative_error:>15.5e}")
+    print("-" * 85)
+    print("\nError-versus-time slopes:")
+    for method, slope in fit_slopes(records).items():
+        print(f"{method:>16} | {slope:>8.3f}")
@@ -1,8 +1,13 @@
 import math
 import time
-import random
 import numpy as np
 
+from ._montecarlo import MonteCarloEngine, DEFAULT_BLOCK_SIZE, parallel_count_hits
+from ._montecarlo import qmc_estimate, qmc_samples_to_reach
+from ._quadrature import QuadratureResult, TrapezoidalSweep, integrate, semicircle
+from ._series import DEFAULT_CHUNK_SIZE, euler_partial_sums, iter_euler_partial_sums
+from ._parallel import ChunkScheduler, grid_sum_threaded, reciprocal_squares_sum_threaded
+
 
 class TrapezoidalMethod:
 
@@ -10,66 +15,206 @@ class TrapezoidalMethod:
         self.N = N
 
     def trapezoidal_pi(self, N: int) -> float:
+        """
+        Calculate pi as twice the area under the half unit circle, using the
+        composite trapezoidal rule with N intervals on [-1, 1].
+
+        Parameters:
+        N (int): Number of intervals.
+
+        Returns:
+        float: Estimated value of pi.
+        """
+        return self.quadrature_pi("trapezoid", N=N).value
+
+    def quadrature_pi(self, rule: str = "gauss_kronrod", N: int | None = None,
+                      tol: float | None = None) -> QuadratureResult:
+        """
+        Calculate pi as twice the area under the half unit circle with any rule of
+        the quadrature engine (trapezoid, simpson, romberg, gauss_legendre, gauss_kronrod).
+
+        Parameters:
+        rule (str): Name of the quadrature rule.
+        N (int | None): Number of intervals or nodes.
+        tol (float | None): Target absolute error on the area.
+
+        Returns:
+        QuadratureResult: Estimated pi with its error estimate and evaluation count.
+        """
+        area = integrate(semicircle, -1.0, 1.0, rule, N=N, tol=tol)
+        return QuadratureResult(2 * area.value, 2 * area.error, area.nfev)
+
+    def trapezoidal_pi_threaded(self, N: int, workers: int | None = None,
+                                scheduler: ChunkScheduler | None = None) -> float:
+        """
+        Calculate pi with the composite trapezoidal rule, summing the interior
+        points in chunks spread over a thread pool.
+
+        Parameters:
+        N (int): Number of intervals.
+        workers (int | None): Number of threads, defaults to the number of CPUs.
+        scheduler (ChunkScheduler | None): Scheduler to reuse instead of workers.
+
+        Returns:
+        float: Estimated value of pi.
+        """
+        scheduler = scheduler or ChunkScheduler(workers)
         a = -1.0
         b = 1.0
         delta_x = (b - a) / N
-        total = 0.0
+        # semicircle vanishes at both ends, so only the interior points count
+        total = grid_sum_threaded(semicircle, a + delta_x, delta_x, N - 1, scheduler)
+        return 2 * delta_x * total
 
-        for i in range(1, N):
-            x = a + i * delta_x
-            total += math.sqrt(1 - x**2)
+    def trapezoidal_sweep(self, n: int = 10) -> TrapezoidalSweep:
+        """
+        Start a nested trapezoidal sweep over the half unit circle. Each call to
+        refine() on the sweep only evaluates the new points; the trapezoidal sum
+        and its extrapolations are areas, so pi is twice their value.
 
-        area = (delta_x / 2) * (math.sqrt(1 - a**2) + 2 * total + math.sqrt(1 - b**2))
-        pi_estimate = 2 * area 
-        return pi_estimate
+        Parameters:
+        n (int): Number of intervals of the first level.
+
+        Returns:
+        TrapezoidalSweep: Incremental trapezoid/Romberg sweep.
+        """
+        return TrapezoidalSweep(semicircle, -1.0, 1.0, n)
 
     def trapezoidal_example(self) -> None:
+        # N goes up by a factor 10 at each row, so one nested sweep reuses
+        # every previous evaluation; the time is the cost of that row alone.
         N_values = [10, 100, 1000, 10000, 100000, 1000000]
         print("\nTrapezoidal Method:\n")
         print(f"{'N':>10} | {'Estimated π':>15} | {'Relative Error':>15} | {'Time (s)':>10}")
         print("-" * 60)
+        start_time = time.time()
+        sweep = self.trapezoidal_sweep(N_values[0])
+        level = sweep.level
         for N in N_values:
-            start_time = time.time()
-            pi_val = self.trapezoidal_pi(N)
+            if N != level.n:
+                level = sweep.refine(N // level.n)
             end_time = time.time()
+            pi_val = 2 * level.trapezoid
             relative_error = abs(math.pi - pi_val) / math.pi
             computation_time = end_time - start_time
             print(f"{N:>10} | {pi_val:>15.10f} | {relative_error:15.5e} | {computation_time:10.6f}")
+            start_time = time.time()
         
         print("-" * 60)
 
+    def quadrature_example(self, tol: float = 1e-8) -> None:
+        rules = ["trapezoid", "simpson", "romberg", "gauss_legendre", "gauss_kronrod"]
+        print(f"\nQuadrature Rules (tolerance {tol:.0e}):\n")
+        print(f"{'Rule':>15} | {'Estimated π':>15} | {'Relative Error':>15} | {'Error Est.':>12} | {'Evaluations':>11} | {'Time (s)':>10}")
+        print("-" * 95)
+        for rule in rules:
+            start_time = time.time()
+            result = self.quadrature_pi(rule, tol=tol)
+            end_time = time.time()
+            relative_error = abs(math.pi - result.value) / math.pi
+            computation_time = end_time - start_time
+            print(f"{rule:>15} | {result.value:>15.10f} | {relative_error:>15.5e} | {result.error:>12.5e} | {result.nfev:>11} | {computation_time:>10.6f}")
+        print("-" * 95)
+
 
 
 class StochasticMethod:
 
-    def __init__(self, N: int) -> None:
+    def __init__(self, N: int, seed=None, block_size: int = DEFAULT_BLOCK_SIZE) -> None:
         self.N = N
+        self.seed = seed
+        self.block_size = block_size
+        self.engine = MonteCarloEngine(seed, block_size)
 
 
     def stochastic_pi(self, N: int) -> float:
-        inside_circle = 0
-        for _ in range(N):
-            x = random.uniform(-1, 1)
-            y = random.uniform(-1, 1)
-            if x**2 + y**2 <= 1:
-                inside_circle += 1
-        pi_estimate = 4 * inside_circle / N
-        return pi_estimate
+        """
+        Estimate pi by drawing N random points and counting those inside the unit circle.
+
+        Parameters:
+        N (int): Number of random points.
+
+        Returns:
+        float: Estimated value of pi.
+        """
+        return self.engine.estimate(N)
+
+    def stochastic_pi_parallel(self, N: int, workers: int | None = None,
+                               block_size: int | None = None) -> float:
+        """
+        Estimate pi from N random points drawn by several processes.
+
+        For a given seed the result does not depend on the number of workers.
+
+        Parameters:
+        N (int): Number of random points.
+        workers (int | None): Number of processes, defaults to the number of CPUs.
+        block_size (int | None): Points per block, defaults to the method's block size.
+
+        Returns:
+        float: Estimated value of pi.
+        """
+        result = parallel_count_hits(N, self.seed, workers, block_size or self.block_size)
+        return result.estimate
+
+    def quasi_stochastic_pi(self, N: int, kind: str = "sobol", replicates: int = 8) -> float:
+        """
+        Estimate pi from N scrambled low-discrepancy points (Sobol or Halton).
+
+        Parameters:
+        N (int): Total number of points over all replicates.
+        kind (str): "sobol" or "halton".
+        replicates (int): Number of independent scramblings.
+
+        Returns:
+        float: Estimated value of pi.
+        """
+        return qmc_estimate(N, kind, replicates, self.seed).estimate
+
+    def stochastic_stream(self, confidence: float = 0.95, max_samples: int | None = None):
+        """
+        Yield the running estimate of pi, its standard error and confidence
+        interval after every block of random points.
+        """
+        return self.engine.stream(confidence, max_samples)
+
+    def run_until(self, rel_tol: float, max_samples: int | None = None,
+                  max_seconds: float | None = None, confidence: float = 0.95):
+        """
+        Draw random points until the confidence interval on pi is within rel_tol
+        of the estimate, or until max_samples points or max_seconds have been used.
+        """
+        return self.engine.run_until(rel_tol, max_samples, max_seconds, confidence)
 
     def stochastic_example(self):
         N_values = [10, 100, 1000, 10000, 100000, 1000000]
         print("\nStochastic Method:\n")
 
-        print(f"{'N':>10} | {'Estimated π':>15} | {'Relative Error':>15} | {'Time (s)':>10}")
-        print("-" * 60)
+        # QMC N: scrambled Sobol points whose standard error matches the expected
+        # relative error sqrt((4 - π) / (π N)) of N plain Monte Carlo points
+        print(f"{'N':>10} | {'Estimated π':>15} | {'Relative Error':>15} | {'Time (s)':>10} | {'QMC N':>10}")
+        print("-" * 73)
         for N in N_values:
             start_time = time.time()
             pi_val = self.stochastic_pi(N)
             end_time = time.time()
             relative_error = abs(math.pi - pi_val) / math.pi
             computation_time = end_time - start_time
-            print(f"{N:>10} | {pi_val:>15.10f} | {relative_error:>15.5e} | {computation_time:>10.6f}")
-        print("-" * 60)
+            qmc_N = qmc_samples_to_reach(math.sqrt((4 - math.pi) / (math.pi * N)), seed=self.seed)
+            qmc_text = f"{qmc_N:>10}" if qmc_N is not None else f"{'> 2^24':>10}"
+            print(f"{N:>10} | {pi_val:>15.10f} | {relative_error:>15.5e} | {computation_time:>10.6f} | {qmc_text}")
+        print("-" * 73)
+
+    def run_until_example(self):
+        rel_tols = [1e-2, 1e-3, 1e-4]
+        print("\nStochastic Method (sequential stopping, 95% confidence):\n")
+
+        print(f"{'Tolerance':>10} | {'N':>12} | {'Estimated π':>15} | {'Std Error':>12} | {'Time (s)':>10}")
+        print("-" * 73)
+        for rel_tol in rel_tols:
+            result = self.run_until(rel_tol, max_samples=10**9, max_seconds=60)
+            print(f"{rel_tol:>10.0e} | {result.samples:>12} | {result.estimate:>15.10f} | {result.stderr:>12.5e} | {result.elapsed:>10.6f}")
+        print("-" * 73)
 
         
 
@@ -94,22 +239,76 @@ class EulerMethod:
         pi_estimate = math.sqrt(6 * num)
         return pi_estimate
 
+    def calc_pi_by_euler_chunked(self, N: int, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                                 compensated: bool = True, tail_correction: bool = False) -> float:
+        """
+        Calculate pi using Euler's series, generating the terms in fixed-size chunks.
+
+        Memory use does not depend on N, so N = 1e9 and beyond is possible.
+
+        Parameters:
+        N (int): Number of terms in the series.
+        chunk_size (int): Maximum number of terms held in memory at once.
+        compensated (bool): Accumulate the chunk sums with Neumaier compensation.
+        tail_correction (bool): Add the Euler–Maclaurin estimate of the terms past N.
+
+        Returns:
+        float: Estimated value of pi.
+        """
+        num = euler_partial_sums([N], chunk_size, compensated, tail_correction)[N]
+        return math.sqrt(6 * num)
+
+    def calc_pi_by_euler_threaded(self, N: int, workers: int | None = None,
+                                  scheduler: ChunkScheduler | None = None) -> float:
+        """
+        Calculate pi using Euler's series, summing the terms in chunks spread
+        over a thread pool. The result does not depend on the number of threads.
+
+        Parameters:
+        N (int): Number of terms in the series.
+        workers (int | None): Number of threads, defaults to the number of CPUs.
+        scheduler (ChunkScheduler | None): Scheduler to reuse instead of workers.
+
+        Returns:
+        float: Estimated value of pi.
+        """
+        scheduler = scheduler or ChunkScheduler(workers)
+        return math.sqrt(6 * reciprocal_squares_sum_threaded(N, scheduler))
+
+    def euler_partial_pis(self, N_values, compensated: bool = True,
+                          tail_correction: bool = False) -> dict:
+        """
+        Estimate pi for every N in N_values with a single sweep over the series.
+
+        Parameters:
+        N_values (iterable of int): Numbers of terms.
+        compensated (bool): Accumulate the chunk sums with Neumaier compensation.
+        tail_correction (bool): Add the Euler–Maclaurin estimate of the terms past N.
+
+        Returns:
+        dict[int, float]: Estimated value of pi for each N.
+        """
+        sums = euler_partial_sums(N_values, compensated=compensated, tail_correction=tail_correction)
+        return {N: math.sqrt(6 * num) for N, num in sums.items()}
+
     def euler_example(self):
+        # One sweep over the series; each row only adds the terms since the
+        # previous N, and its time is the cost of those terms alone.
         N_values = [10, 100, 1000, 10000, 100000, 1000000]
         print("\nEuler Method:\n")
 
         print(f"{'N':>10} | {'Estimated π':>15} | {'Relative Error':>15} | {'Time (s)':>10}")
         print("-" * 60)
 
-        for N in N_values:
-            start_time = time.time()
-            pi_est = self.calc_pi_by_euler_numpy(N)
+        start_time = time.time()
+        for N, num in iter_euler_partial_sums(N_values):
             end_time = time.time()
+            pi_est = math.sqrt(6 * num)
 
             relative_error = abs(math.pi - pi_est) / math.pi
 
             computation_time = end_time - start_time
 
             print(f"{N:>10} | {pi_est:>15.10f} | {relative_error:>15.5e} | {computation_time:>10.6f}")
-        print("-" * 60)
-
+            start_time = time.time()
+        print("-" * 60)
\ No newline at end of file
@@ -0,0 +1,536 @@
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+
+# Largest number of abscissae evaluated in one vectorized call; bigger
+# grids are summed chunk by chunk so memory does not grow with N.
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# 15-point Kronrod abscissae and weights on [-1, 1] (QUADPACK qk15), listed
+# from the outermost node to the centre, with the weights of the embedded
+# 7-point Gauss rule that uses every other node.
+_KRONROD_NODES = np.array([
+    0.991455371120812639206854697526329, 0.949107912342758524526189684047851,
+    0.864864423359769072789712788640926, 0.741531185599394439863864773280788,
+    0.586087235467691130294144845693013, 0.405845151377397166906606412076961,
+    0.207784955007898467600689403773245, 0.000000000000000000000000000000000,
+])
+_KRONROD_WEIGHTS = np.array([
+    0.022935322010529224963732008058970, 0.063092092629978553290700663189204,
+    0.104790010322250183839876322541518, 0.140653259715525918745189590510238,
+    0.169004726639267902826583426598550, 0.190350578064785409913256402421014,
+    0.204432940075298892414161999234649, 0.209482141084727828012999174891714,
+])
+_GAUSS7_WEIGHTS = np.array([
+    0.129484966168869693270611432679082, 0.279705391489276667901467771423780,
+    0.381830050505118944950369775488975, 0.417959183673469387755102040816327,
+])
+
+# Full 15-point tables, symmetric about the centre.
+GK15_NODES = np.concatenate([-_KRONROD_NODES, _KRONROD_NODES[-2::-1]])
+GK15_WEIGHTS = np.concatenate([_KRONROD_WEIGHTS, _KRONROD_WEIGHTS[-2::-1]])
+G7_WEIGHTS = np.zeros(15)
+G7_WEIGHTS[1::2] = np.concatenate([_GAUSS7_WEIGHTS, _GAUSS7_WEIGHTS[-2::-1]])
+
+
+@dataclass
+class QuadratureResult:
+    """
+    Value of a definite integral with its error estimate.
+
+    Attributes:
+    value (float): Estimated integral.
+    error (float): Estimated absolute error.
+    nfev (int): Number of integrand evaluations used.
+    """
+    value: float
+    error: float
+    nfev: int
+
+
+def semicircle(x: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Upper half of the unit circle, sqrt(1 - x**2), clipped at zero for |x| >= 1.
+
+    With out=x the values are computed in place without temporaries.
+    """
+    out = np.multiply(x, x, out=out)
+    np.subtract(1.0, out, out=out)
+    np.maximum(out, 0.0, out=out)
+    return np.sqrt(out, out=out)
+
+
+def grid_sum(f, start: float, step: float, count: int,
+             chunk_size: int = DEFAULT_CHUNK_SIZE) -> float:
+    """
+    Sum f(start + k * step) for k = 0, ..., count - 1, one chunk at a time.
+
+    Parameters:
+    f (callable): Vectorized integrand.
+    start (float): First abscissa.
+    step (float): Spacing of the abscissae.
+    count (int): Number of abscissae.
+    chunk_size (int): Maximum number of abscissae evaluated at once.
+
+    Returns:
+    float: Sum of the integrand over the grid.
+    """
+    total = 0.0
+    offsets = np.arange(min(count, chunk_size), dtype=float)
+    x = np.empty_like(offsets)
+    for first in range(0, count, chunk_size):
+        m = min(chunk_size, count - first)
+        np.multiply(offsets[:m] + first, step, out=x[:m])
+        x[:m] += start
+        total += float(np.sum(f(x[:m])))
+    return total
+
+
+def _halving_error(history: list, order: int) -> float:
+    """
+    Error estimate of the last of successive estimates, each on half the step of the previous one.
+
+    The rule converges like h**order for smooth integrands, but only like
+    h**1.5 for the semicircle, whose derivative blows up at the ends. The
+    convergence ratio is therefore measured on the last three estimates,
+    |I_n - I_n/2| / |I_2n - I_n|, and clamped to [2, 2**order] so the
+    estimate is never below |I_2n - I_n|. With fewer than three estimates
+    the error is unknown (inf).
+    """
+    if len(history) < 3:
+        return math.inf
+    coarse, middle, fine = history
+    difference = abs(fine - middle)
+    if difference == 0:
+        return 0.0
+    ratio = min(max(abs(middle - coarse) / difference, 2.0), 2.0 ** order)
+    return difference / (ratio - 1)
+
+
+def trapezoid(f, a: float, b: float, N: int | None = None, tol: float | None = None,
+              max_nfev: int = 1 << 30) -> QuadratureResult:
+    """
+    Composite trapezoidal rule.
+
+    With a fixed N the error is estimated from the rule on every other node
+    (N must be even for that, otherwise the error is nan). With a tolerance
+    the number of intervals is doubled, reusing every previous evaluation,
+    until the Richardson error estimate |T_2n - T_n| / (r - 1) is below tol,
+    r being the convergence ratio observed over the last three levels
+    (4 for smooth integrands).
+
+    Parameters:
+    f (callable): Vectorized integrand.
+    a, b (float): Integration bounds.
+    N (int | None): Number of intervals, or the starting number when tol is given.
+    tol (float | None): Target absolute error.
+    max_nfev (int): Maximum number of evaluations in tolerance mode.
+
+    Returns:
+    QuadratureResult: Integral, error estimate and evaluation count.
+    """
+    if tol is None:
+        if N is None or N <= 0:
+            raise ValueError("N must be a positive integer when no tolerance is given")
+        h = (b - a) / N
+        ends = float(f(np.array([a]))[0] + f(np.array([b]))[0])
+        odd = grid_sum(f, a + h, 2 * h, N // 2)
+        even = grid_sum(f, a + 2 * h, 2 * h, (N - 1) // 2)
+        value = h * (ends / 2 + odd + even)
+        error = math.nan
+        if N % 2 == 0:
+            error = abs(value - 2 * h * (ends / 2 + even)) / 3
+        return QuadratureResult(value, error, N + 1)
+
+    history = []
+    for n, value, nfev in _trapezoid_levels(f, a, b, N or 1):
+        history = history[-2:] + [value]
+        error = _halving_error(history, 2)
+        if error <= tol or nfev >= max_nfev:
+            return QuadratureResult(value, error, nfev)
+
+
+def simpson(f, a: float, b: float, N: int | None = None, tol: float | None = None,
+            max_nfev: int = 1 << 30) -> QuadratureResult:
+    """
+    Composite Simpson rule, S_2n = (4 T_2n - T_n) / 3.
+
+    With a fixed (even) N the error is estimated against Simpson on half as
+    many intervals when N is a multiple of 4. With a tolerance N is doubled
+    until |S_2n - S_n| / (r - 1) is below tol, r being the convergence ratio
+    observed over the last three levels (16 for smooth integrands).
+
+    Parameters:
+    f (callable): Vectorized integrand.
+    a, b (float): Integration bounds.
+    N (int | None): Even number of intervals, or the starting number when tol is given.
+    tol (float | None): Target absolute error.
+    max_nfev (int): Maximum number of evaluations in tolerance mode.
+
+    Returns:
+    QuadratureResult: Integral, error estimate and evaluation count.
+    """
+    if tol is None:
+        if N is None or N <= 0 or N % 2:
+            raise ValueError("N must be a positive even integer when no tolerance is given")
+        h = (b - a) / N
+        ends = float(f(np.array([a]))[0] + f(np.array([b]))[0])
+        odd = grid_sum(f, a + h, 2 * h, N // 2)
+        even = grid_sum(f, a + 2 * h, 2 * h, N // 2 - 1)
+        value = h / 3 * (ends + 4 * odd + 2 * even)
+        error = math.nan
+        if N % 4 == 0:
+            quarter = grid_sum(f, a + 2 * h, 4 * h, N // 4)
+            coarse = 2 * h / 3 * (ends + 4 * quarter + 2 * (even - quarter))
+            error = abs(value - coarse) / 15
+        return QuadratureResult(value, error, N + 1)
+
+    levels = _trapezoid_levels(f, a, b, N or 1)
+    _, t_fine, _ = next(levels)
+    history = []
+    for n, value, nfev in levels:
+        t_coarse, t_fine = t_fine, value
+        history = history[-2:] + [(4 * t_fine - t_coarse) / 3]
+        error = _halving_error(history, 4)
+        if error <= tol or nfev >= max_nfev:
+            return QuadratureResult(history[-1], error, nfev)
+
+
+def romberg(f, a: float, b: float, N: int | None = None, tol: float | None = 1e-10,
+            max_nfev: int = 1 << 30, max_order: int = 12) -> QuadratureResult:
+    """
+    Romberg integration: Richardson extrapolation of nested trapezoidal sums.
+
+    Rows of the tableau are added until the two last diagonal entries agree
+    to within tol.
+
+    Parameters:
+    f (callable): Vectorized integrand.
+    a, b (float): Integration bounds.
+    N (int | None): Number of intervals of the first trapezoidal sum.
+    tol (float | None): Target absolute error.
+    max_nfev (int): Maximum number of evaluations.
+    max_order (int): Maximum number of extrapolation columns.
+
+    Returns:
+    QuadratureResult: Integral, error estimate and evaluation count.
+    """
+    tol = 1e-10 if tol is None else tol
+    sweep = TrapezoidalSweep(f, a, b, N or 1, max_order=max_order)
+    previous = sweep.level
+    while True:
+        level = sweep.refine()
+        error = abs(level.extrapolated[-1] - previous.extrapolated[-1])
+        if error <= tol or level.nfev >= max_nfev:
+            return QuadratureResult(level.extrapolated[-1], error, level.nfev)
+        previous = level
+
+
+@dataclass
+class SweepLevel:
+    """
+    One level of a TrapezoidalSweep.
+
+    Attributes:
+    n (int): Number of intervals.
+    trapezoid (float): Trapezoidal sum on n intervals.
+    extrapolated (list[float]): Row of the Richardson tableau, from the
+        trapezoidal sum itself to the highest-order extrapolation.
+    nfev (int): Evaluations used by the sweep so far.
+    """
+    n: int
+    trapezoid: float
+    extrapolated: list
+    nfev: int
+
+
+class TrapezoidalSweep:
+
+    def __init__(self, f, a: float, b: float, n: int = 1, max_order: int = 12,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """
+        Nested trapezoidal sums that keep their running total between refinements.
+
+        Every call to refine() divides each interval into `factor` parts and
+        only evaluates the new abscissae, so a whole convergence table costs
+        about as much as its finest level alone. Each level also carries the
+        Richardson (Romberg) extrapolations of the levels computed so far,
+        which assume an error expansion in even powers of the step.
+
+        Parameters:
+        f (callable): Vectorized integrand.
+        a, b (float): Integration bounds.
+        n (int): Number of intervals of the first level.
+        max_order (int): Maximum number of extrapolation columns.
+        chunk_size (int): Maximum number of abscissae evaluated at once.
+        """
+        if n <= 0:
+            raise ValueError("n must be a positive integer")
+        self.f = f
+        self.a = a
+        self.b = b
+        self.max_order = max_order
+        self.chunk_size = chunk_size
+
+        self.n = n
+        self.total = float(f(np.array([a]))[0] + f(np.array([b]))[0]) / 2
+        self.total += grid_sum(f, a + self.step, self.step, n - 1, chunk_size)
+        self.nfev = n + 1
+        self.steps = [self.step]
+        self.level = SweepLevel(n, self.step * self.total, [self.step * self.total], self.nfev)
+
+    @property
+    def step(self) -> float:
+        return (self.b - self.a) / self.n
+
+    def refine(self, factor: int = 2) -> SweepLevel:
+        """
+        Split every interval into `factor` parts, evaluating only the new points.
+
+        Parameters:
+        factor (int): Refinement ratio, at least 2.
+
+        Returns:
+        SweepLevel: Trapezoidal sum and extrapolations on the refined grid.
+        """
+        if factor < 2:
+            raise ValueError("factor must be at least 2")
+        h = self.step
+        for j in range(1, factor):
+            self.total += grid_sum(self.f, self.a + j * h / factor, h, self.n, self.chunk_size)
+        self.nfev += (factor - 1) * self.n
+        self.n *= factor
+        self.steps.append(self.step)
+
+        # Richardson tableau row in Neville form: column j extrapolates in h²
+        # from levels k - j to k, so the weight is the squared ratio of their
+        # steps (4**j for halving) and mixed factors are allowed.
+        row = [self.step * self.total]
+        previous = self.level.extrapolated
+        k = len(self.steps) - 1
+        for j in range(1, min(len(previous) + 1, self.max_order)):
+            ratio = (self.steps[k - j] / self.steps[k]) ** 2
+            row.append(row[j - 1] + (row[j - 1] - previous[j - 1]) / (ratio - 1))
+        self.level = SweepLevel(self.n, row[0], row, self.nfev)
+        return self.level
+
+
+def _trapezoid_levels(f, a: float, b: float, n: int, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Yield (n, T_n, nfev) for n, 2n, 4n, ... evaluating only the new midpoints.
+    """
+    sweep = TrapezoidalSweep(f, a, b, n, max_order=1, chunk_size=chunk_size)
+    level = sweep.level
+    while True:
+        yield level.n, level.trapezoid, level.nfev
+        level = sweep.refine()
+
+
+@lru_cache(maxsize=None)
+def legendre_nodes(n: int) -> tuple:
+    """
+    Gauss–Legendre abscissae and weights of order n on [-1, 1], cached per order.
+    """
+    return np.polynomial.legendre.leggauss(n)
+
+
+def _gauss_legendre_fixed(f, a: float, b: float, n: int) -> float:
+    nodes, weights = legendre_nodes(n)
+    half = (b - a) / 2
+    return float(half * np.dot(weights, f(half * nodes + (a + b) / 2)))
+
+
+def gauss_legendre(f, a: float, b: float, N: int | None = None, tol: float | None = None,
+                   max_order: int = 1 << 10) -> QuadratureResult:
+    """
+    Gauss–Legendre quadrature.
+
+    With a fixed order N the error is estimated against the rule of order
+    N // 2. With a tolerance the order is doubled, starting from N (or 8),
+    until two consecutive orders agree to within tol.
+
+    Parameters:
+    f (callable): Vectorized integrand.
+    a, b (float): Integration bounds.
+    N (int | None): Number of nodes, or the starting number when tol is given.
+    tol (float | None): Target absolute error.
+    max_order (int): Largest number of nodes in tolerance mode.
+
+    Returns:
+    QuadratureResult: Integral, error estimate and evaluation count.
+    """
+    if tol is None:
+        if N is None or N <= 0:
+            raise ValueError("N must be a positive integer when no tolerance is given")
+        value = _gauss_legendre_fixed(f, a, b, N)
+        if N < 2:
+            return QuadratureResult(value, math.nan, N)
+        coarse = _gauss_legendre_fixed(f, a, b, N // 2)
+        return QuadratureResult(value, abs(value - coarse), N + N // 2)
+
+    n = N or 8
+    previous = _gauss_legendre_fixed(f, a, b, n)
+    nfev = n
+    while True:
+        n *= 2
+        value = _gauss_legendre_fixed(f, a, b, n)
+        nfev += n
+        error = abs(value - previous)
+        if error <= tol or n >= max_order:
+            return QuadratureResult(value, error, nfev)
+        previous = value
+
+
+def gauss_kronrod(f, a: float, b: float, N: int | None = None, tol: float | None = 1e-10,
+                  max_intervals: int = 1 << 16) -> QuadratureResult:
+    """
+    Adaptive 7/15-point Gauss–Kronrod quadrature.
+
+    The interval is split into N panels. Every pass evaluates all unresolved
+    panels in one vectorized call, accepts those whose error |K15 - G7| is
+    below their share of tol (in proportion to their width) and bisects the
+    others, so the evaluations concentrate near singularities such as the
+    square-root endpoints of the quarter circle.
+
+    Parameters:
+    f (callable): Vectorized integrand.
+    a, b (float): Integration bounds.
+    N (int | None): Number of initial panels.
+    tol (float | None): Target absolute error.
+    max_intervals (int): Maximum number of panels evaluated in one pass.
+
+    Returns:
+    QuadratureResult: Integral, error estimate and evaluation count.
+    """
+    tol = 1e-10 if tol is None else tol
+    edges = np.linspace(a, b, (N or 1) + 1)
+    lo, hi = edges[:-1], edges[1:]
+    value = 0.0
+    error = 0.0
+    nfev = 0
+    while lo.size:
+        centre = (lo + hi) / 2
+        half = (hi - lo) / 2
+        fx = f(centre[:, None] + half[:, None] * GK15_NODES)
+        nfev += fx.size
+        kronrod = half * (fx @ GK15_WEIGHTS)
+        panel_error = np.abs(kronrod - half * (fx @ G7_WEIGHTS))
+
+        done = panel_error <= tol * (2 * half) / abs(b - a)
+        if 2 * np.count_nonzero(~done) > max_intervals:
+            done[:] = True
+        value += float(np.sum(kronrod[done]))
+        error += float(np.sum(panel_error[done]))
+        lo, hi, centre = lo[~done], hi[~done], centre[~done]
+        lo, hi = np.concatenate([lo, centre]), np.concatenate([centre, hi])
+    return QuadratureResult(value, error, nfev)
+
+
+# Bytes the batched integrator may spend on node grids at once; each grid
+# value needs a few float64 arrays (abscissae, integrand, temporaries).
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+_BYTES_PER_NODE = 4 * 8
+
+
+@dataclass
+class BatchQuadratureResult:
+    """
+    Values of many definite integrals with their error estimates.
+
+    Attributes:
+    values (np.ndarray): Estimated integrals, one per pair of bounds.
+    errors (np.ndarray): Estimated absolute errors.
+    nfev (int): Total number of integrand evaluations.
+    """
+    values: np.ndarray
+    errors: np.ndarray
+    nfev: int
+
+
+def integrate_batch(f, a, b, args: tuple = (), panels: int = 1,
+                    memory_budget: int = DEFAULT_MEMORY_BUDGET) -> BatchQuadratureResult:
+    """
+    Integrate f over many intervals [a[i], b[i]] with composite 7/15-point Gauss–Kronrod.
+
+    All integrals of a chunk are evaluated in one call to f on a 2-D grid
+    of shape (integrals, panels * 15), so a parameterized family of curves
+    costs a handful of NumPy calls instead of one Python call per integral.
+    Chunks are sized so the grids stay within the memory budget.
+
+    f is called as f(x, *args) where x has shape (m, panels * 15). Arrays
+    in args are per-integral parameters: they are broadcast against a and b,
+    sliced to the chunk and given a trailing axis so they line up with the
+    rows of x. Scalars and other objects are passed through unchanged.
+
+    Parameters:
+    f (callable): Vectorized integrand.
+    a, b (array_like): Lower and upper bounds.
+    args (tuple): Extra arguments of f, typically per-integral parameters.
+    panels (int): Number of equal panels per integral.
+    memory_budget (int): Maximum bytes of node grids held at once.
+
+    Returns:
+    BatchQuadratureResult: Integrals and error estimates with the broadcast shape of a, b and args.
+    """
+    if panels <= 0:
+        raise ValueError("panels must be positive")
+    per_integral = [isinstance(arg, np.ndarray) and arg.ndim > 0 for arg in args]
+    arrays = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float),
+                                 *[arg for arg, sliced in zip(args, per_integral) if sliced])
+    shape = arrays[0].shape
+    a, b = arrays[0].ravel(), arrays[1].ravel()
+    parameters = iter(array.ravel() for array in arrays[2:])
+    args = [next(parameters) if sliced else arg for arg, sliced in zip(args, per_integral)]
+    n = a.size
+    nodes = 15 * panels
+    rows = max(1, memory_budget // (nodes * _BYTES_PER_NODE))
+
+    edges = np.linspace(0.0, 1.0, panels + 1)
+    values = np.empty(n)
+    errors = np.empty(n)
+    for first in range(0, n, rows):
+        last = min(n, first + rows)
+        lo = a[first:last, None] + (b - a)[first:last, None] * edges[:-1]
+        half = (b - a)[first:last, None] / (2 * panels)
+        x = (lo + half)[:, :, None] + half[:, :, None] * GK15_NODES
+        chunk_args = [arg[first:last, None] if sliced else arg
+                      for arg, sliced in zip(args, per_integral)]
+        fx = np.asarray(f(x.reshape(last - first, nodes), *chunk_args), dtype=float)
+        fx = fx.reshape(last - first, panels, 15)
+        kronrod = half * (fx @ GK15_WEIGHTS)
+        gauss = half * (fx @ G7_WEIGHTS)
+        values[first:last] = kronrod.sum(axis=1)
+        errors[first:last] = np.abs(kronrod - gauss).sum(axis=1)
+    return BatchQuadratureResult(values.reshape(shape), errors.reshape(shape), n * nodes)
+
+
+RULES = {
+    "trapezoid": trapezoid,
+    "simpson": simpson,
+    "romberg": romberg,
+    "gauss_legendre": gauss_legendre,
+    "gauss_kronrod": gauss_kronrod,
+}
+
+
+def integrate(f, a: float, b: float, rule: str = "gauss_kronrod", N: int | None = None,
+              tol: float | None = None) -> QuadratureResult:
+    """
+    Integrate a vectorized function over [a, b] with one of the rules in RULES.
+
+    Parameters:
+    f (callable): Vectorized integrand.
+    a, b (float): Integration bounds.
+    rule (str): Name of the quadrature rule.
+    N (int | None): Number of intervals or nodes, meaning depends on the rule.
+    tol (float | None): Target absolute error.
+
+    Returns:
+    QuadratureResult: Integral, error estimate and evaluation count.
+    """
+    if rule not in RULES:
+        raise ValueError(f"Unknown quadrature rule {rule!r}, expected one of {sorted(RULES)}")
+    return RULES[rule](f, a, b, N=N, tol=tol)
@@ -0,0 +1,129 @@
+import math
+
+import numpy as np
+
+
+# Number of terms evaluated at once; the scratch buffers never grow past it.
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Bernoulli numbers B_2, B_4, ... of the Euler–Maclaurin tail expansion.
+_BERNOULLI = [1 / 6, -1 / 30, 1 / 42, -1 / 30, 5 / 66]
+
+
+class CompensatedSum:
+
+    def __init__(self) -> None:
+        """
+        Running sum with Neumaier (improved Kahan) compensation.
+
+        The low-order bits lost by each addition are kept in a separate
+        correction term, so adding many small terms to a large total does
+        not lose digits.
+        """
+        self.total = 0.0
+        self.correction = 0.0
+
+    def add(self, value: float) -> None:
+        total = self.total + value
+        if abs(self.total) >= abs(value):
+            self.correction += (self.total - total) + value
+        else:
+            self.correction += (value - total) + self.total
+        self.total = total
+
+    @property
+    def value(self) -> float:
+        return self.total + self.correction
+
+
+class _PlainSum:
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def add(self, value: float) -> None:
+        self.value += value
+
+
+def euler_tail(N: int) -> float:
+    """
+    Euler–Maclaurin estimate of the tail sum_{k > N} 1 / k**2.
+
+    Parameters:
+    N (int): Number of terms already summed.
+
+    Returns:
+    float: Estimated remainder of the series.
+    """
+    if N <= 0:
+        return math.pi ** 2 / 6
+    tail = 1 / N - 1 / (2 * N ** 2)
+    for j, bernoulli in enumerate(_BERNOULLI, start=1):
+        tail += bernoulli / N ** (2 * j + 1)
+    return tail
+
+
+def reciprocal_squares_sum(first: int, last: int, base: np.ndarray, out: np.ndarray) -> float:
+    """
+    Sum 1 / k**2 for first <= k < last using preallocated buffers.
+
+    Parameters:
+    first, last (int): Range of k, with last - first <= len(out).
+    base (np.ndarray): Float array holding 0, 1, 2, ... at least last - first long.
+    out (np.ndarray): Scratch buffer of the same length.
+
+    Returns:
+    float: Pairwise sum of the terms.
+    """
+    m = last - first
+    terms = out[:m]
+    np.add(base[:m], first, out=terms)
+    np.multiply(terms, terms, out=terms)
+    np.reciprocal(terms, out=terms)
+    return float(np.sum(terms))
+
+
+def iter_euler_partial_sums(N_values, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                            compensated: bool = True, tail_correction: bool = False):
+    """
+    Sum the series 1 / k**2 once, yielding the partial sum at every requested N.
+
+    Terms are generated chunk by chunk into fixed buffers, so memory use does
+    not depend on N. Each chunk is summed pairwise by NumPy and the chunk
+    sums are accumulated with Neumaier compensation.
+
+    Parameters:
+    N_values (iterable of int): Numbers of terms, visited in increasing order.
+    chunk_size (int): Maximum number of terms evaluated at once.
+    compensated (bool): Use compensated accumulation of the chunk sums.
+    tail_correction (bool): Add the Euler–Maclaurin estimate of the missing tail.
+
+    Yields:
+    tuple[int, float]: N and the (corrected) partial sum of its first N terms.
+    """
+    N_values = sorted(N_values)
+    chunk_size = max(1, min(chunk_size, N_values[-1] if N_values else 1))
+    base = np.arange(chunk_size, dtype=float)
+    out = np.empty(chunk_size)
+    total = CompensatedSum() if compensated else _PlainSum()
+    k = 1
+    for N in N_values:
+        while k <= N:
+            last = min(N + 1, k + chunk_size)
+            total.add(reciprocal_squares_sum(k, last, base, out))
+            k = last
+        partial = total.value
+        if tail_correction:
+            partial += euler_tail(N)
+        yield N, partial
+
+
+def euler_partial_sums(N_values, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                       compensated: bool = True, tail_correction: bool = False) -> dict:
+    """
+    Partial sums of 1 / k**2 for every N in N_values, computed in a single sweep.
+
+    Returns:
+    dict[int, float]: Partial sum for each N.
+    """
+    return dict(iter_euler_partial_sums(N_values, chunk_size, compensated, tail_correction))
@@ -0,0 +1,28 @@
+from ._pipeline import AddNoise
+from ._pipeline import array_source
+from ._pipeline import CumulativeSum
+from ._pipeline import Gradient
+from ._pipeline import run_pipeline
+from ._pipeline import signal_source
+from ._differentiation import differentiate
+from ._differentiation import savgol_derivative
+from ._differentiation import spectral_derivative
+from ._differentiation import tv_derivative
+from ._integration import cumulative_simpson
+from ._integration import cumulative_trapezoid
+from ._integration import estimate_bias
+from ._integration import highpass_detrend
+from ._integration import integrate_acceleration
+from ._ensemble import NoiseStudy
+from ._ensemble import differentiation_chain
+from ._ensemble import integration_chain
+from ._ensemble import noise_study
+from ._kalman import FusionResult
+from ._kalman import KalmanModel
+from ._kalman import OnlineKalmanFilter
+from ._kalman import kalman_filter_batch
+from ._signals import acceleration
+from ._signals import generate_to_npy
+from ._signals import load_signal
+from ._signals import time_axis
+from ._signals import trajectory
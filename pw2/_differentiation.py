@@ -0,0 +1,220 @@
+"""
+Noise-robust numerical differentiation of sampled signals.
+
+Every estimator works on (channels, samples) arrays (1-D signals are
+accepted too) and costs O(n) or O(n log n) per channel:
+
+* Savitzky–Golay: local least-squares polynomial fits, O(n).
+* Spectral: FFT derivative with a smooth low-pass filter, O(n log n).
+* Total variation: l1 trend filtering solved by ADMM, O(n) per iteration.
+
+np.gradient applied twice amplifies white noise of standard deviation
+sigma to roughly sigma / dt**2 in the second derivative; these estimators
+trade a little bias for orders of magnitude less noise.
+"""
+import numpy as np
+from numpy.polynomial import polynomial as P
+from scipy import fft, sparse
+from scipy.linalg import cho_solve_banded, cholesky_banded
+from scipy.signal import savgol_filter
+
+
+def _as_channels(signal) -> tuple:
+    signal = np.asarray(signal, dtype=float)
+    return np.atleast_2d(signal), signal.ndim == 1
+
+
+def savgol_derivative(signal, dt: float, order: int = 1, window: int = 51,
+                      polyorder: int | None = None) -> np.ndarray:
+    """
+    Derivative from Savitzky–Golay local polynomial fits.
+
+    Parameters:
+    signal (np.ndarray): Samples, shape (samples,) or (channels, samples).
+    dt (float): Sampling step.
+    order (int): Order of the derivative.
+    window (int): Odd number of samples of each local fit.
+    polyorder (int | None): Degree of the local polynomials, defaults to order + 2.
+
+    Returns:
+    np.ndarray: Derivative with the shape of signal.
+    """
+    polyorder = order + 2 if polyorder is None else polyorder
+    return savgol_filter(signal, window, polyorder, deriv=order, delta=dt, axis=-1, mode="interp")
+
+
+def _end_curvatures(signals: np.ndarray, dt: float, window: int) -> tuple:
+    """
+    Second derivatives at both ends of each channel, from least-squares cubics over window samples.
+    """
+    u = np.arange(window) * dt
+    head = P.polyfit(u, signals[:, :window].T, 3)
+    tail = P.polyfit(u, signals[:, :-window - 1:-1].T, 3)
+    return 2 * head[2], 2 * tail[2]
+
+
+def spectral_derivative(signal, dt: float, order: int = 1, cutoff: float | None = None,
+                        sharpness: int = 4, window: int | None = None) -> np.ndarray:
+    """
+    Derivative computed in the Fourier domain with a regularizing low-pass filter.
+
+    The spectrum is multiplied by (2πif)**order / (1 + (f / cutoff)**(2 * sharpness)),
+    which damps the high frequencies where differentiation amplifies the
+    noise. The FFT treats the signal as periodic, so a cubic trend is taken
+    out first: it goes through the end samples and has the curvature of
+    cubic fits over window samples at each end. The residual vanishes at
+    both ends with a vanishing second derivative, and its odd reflection
+    about the last sample is a periodic signal of period 2 (n - 1) with
+    three continuous derivatives. The residual is differentiated spectrally
+    without any padding and the trend analytically.
+
+    Parameters:
+    signal (np.ndarray): Samples, shape (samples,) or (channels, samples).
+    dt (float): Sampling step.
+    order (int): Order of the derivative.
+    cutoff (float | None): Cut-off frequency in Hz, no filtering if None.
+    sharpness (int): Order of the Butterworth-like roll-off.
+    window (int | None): Samples of the end fits, defaults to an eighth of the signal.
+
+    Returns:
+    np.ndarray: Derivative with the shape of signal.
+    """
+    signals, flat = _as_channels(signal)
+    n = signals.shape[1]
+    if n < 4:
+        raise ValueError("need at least 4 samples for a spectral derivative")
+    window = min(n, max(4, n // 8 if window is None else window))
+    t = np.arange(n) * dt
+    length = t[-1]
+
+    # Cubic trend p(0) = first, p(length) = last, p''(0) = a, p''(length) = b.
+    first, last = signals[:, 0], signals[:, -1]
+    a, b = _end_curvatures(signals, dt, window)
+    trend = np.stack([first, (last - first) / length - length * (2 * a + b) / 6,
+                      a / 2, (b - a) / (6 * length)])
+    residual = signals - P.polyval(t, trend)
+    extended = np.concatenate([residual, -residual[:, -2:0:-1]], axis=1)
+
+    size = extended.shape[1]
+    spectrum = fft.rfft(extended, axis=1)
+    frequencies = fft.rfftfreq(size, dt)
+    response = (2j * np.pi * frequencies) ** order
+    if cutoff is not None:
+        response /= 1 + (frequencies / cutoff) ** (2 * sharpness)
+    derivative = fft.irfft(spectrum * response, size, axis=1)[:, :n]
+    derivative += P.polyval(t, P.polyder(trend, order))
+    return derivative[0] if flat else derivative
+
+
+def _difference_matrix(n: int, k: int) -> sparse.csr_matrix:
+    """
+    Sparse (n - k) x n matrix of the k-th forward difference.
+    """
+    D = sparse.identity(n, format="csr")
+    for m in range(n, n - k, -1):
+        D = sparse.diags([-np.ones(m - 1), np.ones(m - 1)], [0, 1], shape=(m - 1, m)) @ D
+    return D.tocsr()
+
+
+def _difference_transpose(v: np.ndarray, k: int) -> np.ndarray:
+    """
+    Apply the transpose of the k-th forward difference along axis 0.
+    """
+    for _ in range(k):
+        v = -np.diff(np.pad(v, ((1, 1), (0, 0))), axis=0)
+    return v
+
+
+def tv_derivative(signal, dt: float, order: int = 1, alpha: float = 10.0,
+                  rho: float | None = None, iterations: int = 500) -> np.ndarray:
+    """
+    Derivative whose order-th derivative is piecewise constant (total-variation regularized).
+
+    The signal is smoothed by l1 trend filtering,
+
+        minimize 1/2 ||y - signal||**2 + alpha ||D^(order + 1) y||_1,
+
+    which penalizes the total variation of the order-th difference of y, so
+    y is a piecewise polynomial of degree order and its derivative keeps
+    sharp steps while the noise is removed. The problem is solved by ADMM;
+    the banded system of the y-update is factored once and every iteration
+    costs O(n) for all channels together. The derivative of y is then
+    taken with central differences.
+
+    Parameters:
+    signal (np.ndarray): Samples, shape (samples,) or (channels, samples).
+    dt (float): Sampling step.
+    order (int): Order of the derivative.
+    alpha (float): Regularization weight, in units of the signal.
+    rho (float | None): ADMM penalty parameter, defaults to alpha.
+    iterations (int): Number of ADMM iterations.
+
+    Returns:
+    np.ndarray: Derivative with the shape of signal.
+    """
+    signals, flat = _as_channels(signal)
+    f = signals.T
+    n = f.shape[0]
+    k = order + 1
+    if n <= k:
+        raise ValueError(f"need more than {k} samples for a derivative of order {order}")
+    rho = alpha if rho is None else rho
+
+    D = _difference_matrix(n, k)
+    M = sparse.identity(n) + rho * (D.T @ D)
+    banded = np.zeros((k + 1, n))
+    for offset in range(k + 1):
+        banded[k - offset, offset:] = M.diagonal(offset)
+    factor = cholesky_banded(banded)
+
+    z = np.zeros((n - k, f.shape[1]))
+    w = np.zeros_like(z)
+    threshold = alpha / rho
+    for _ in range(iterations):
+        y = cho_solve_banded((factor, False), f + rho * _difference_transpose(z - w, k))
+        Dy = np.diff(y, k, axis=0)
+        v = Dy + w
+        z = np.sign(v) * np.maximum(np.abs(v) - threshold, 0.0)
+        w = v - z
+
+    derivative = y
+    for _ in range(order):
+        derivative = np.gradient(derivative, dt, axis=0)
+    return derivative.T[0] if flat else derivative.T
+
+
+def gradient_derivative(signal, dt: float, order: int = 1) -> np.ndarray:
+    """
+    Repeated np.gradient, the estimator of section 2.b of pw2, for comparison.
+    """
+    derivative = np.asarray(signal, dtype=float)
+    for _ in range(order):
+        derivative = np.gradient(derivative, dt, axis=-1)
+    return derivative
+
+
+METHODS = {
+    "gradient": gradient_derivative,
+    "savgol": savgol_derivative,
+    "spectral": spectral_derivative,
+    "tv": tv_derivative,
+}
+
+
+def differentiate(signal, dt: float, order: int = 1, method: str = "savgol", **options) -> np.ndarray:
+    """
+    Differentiate sampled signals with one of the estimators in METHODS.
+
+    Parameters:
+    signal (np.ndarray): Samples, shape (samples,) or (channels, samples).
+    dt (float): Sampling step.
+    order (int): Order of the derivative.
+    method (str): Name of the estimator.
+    **options: Extra parameters of the estimator (window, cutoff, alpha, ...).
+
+    Returns:
+    np.ndarray: Derivative with the shape of signal.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown differentiation method {method!r}, expected one of {sorted(METHODS)}")
+    return METHODS[method](signal, dt, order, **options)
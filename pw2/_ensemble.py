@@ -0,0 +1,211 @@
+"""
+Monte Carlo study of how sensor noise propagates through the pw2 processing chains.
+
+Instead of judging the effect of noise and offset from one realization and
+a plot, noise_study draws thousands of noisy copies of a signal as
+(realizations, channels, samples) blocks, runs the whole
+differentiation or integration chain on each block at once and reduces
+the errors to RMS, bias and percentile bands over time. Blocks are sized
+from the peak memory of each chain; when the realizations need several
+blocks the percentiles come from per-sample running histograms.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+from ._differentiation import differentiate
+from ._integration import integrate_acceleration
+
+
+DEFAULT_MEMORY_BUDGET = 256 * 1024 * 1024
+
+HISTOGRAM_BINS = 256
+
+# Smallest histograms, and smallest first block laying out their bins, that noise_study accepts.
+MIN_BINS = 16
+MIN_BLOCK_SIZE = 16
+
+# Peak memory of each chain, its output included, in arrays the size of
+# the block, as measured with tracemalloc.
+CHAIN_ARRAYS = {"gradient": 3, "savgol": 2, "spectral": 11, "tv": 9}
+INTEGRATION_ARRAYS = 2
+HIGHPASS_ARRAYS = 3
+
+# noise_study itself holds the noisy block and one temporary (bin indices or percentile work).
+_STUDY_ARRAYS = 2
+
+
+@dataclass
+class NoiseStudy:
+    """
+    Error statistics of a processing chain over many noise realizations.
+
+    Attributes:
+    realizations (int): Number of noisy copies processed.
+    rms (np.ndarray): Root-mean-square error, shape (channels, samples).
+    bias (np.ndarray): Mean error, shape (channels, samples).
+    percentiles (dict[float, np.ndarray]): Error percentiles, each of shape (channels, samples).
+    exact_percentiles (bool): False when the realizations did not fit in one block and the
+        percentiles come from per-sample histograms, accurate to one bin width.
+    """
+    realizations: int
+    rms: np.ndarray
+    bias: np.ndarray
+    percentiles: dict
+    exact_percentiles: bool
+
+    @property
+    def std(self) -> np.ndarray:
+        """
+        Standard deviation of the error around its bias.
+        """
+        return np.sqrt(np.maximum(self.rms ** 2 - self.bias ** 2, 0.0))
+
+
+def differentiation_chain(dt: float, order: int = 2, method: str = "gradient", **options):
+    """
+    Chain that differentiates every noisy copy, as section 2 of pw2 does with method="gradient".
+    """
+    def chain(block: np.ndarray) -> np.ndarray:
+        rows = block.reshape(-1, block.shape[-1])
+        return differentiate(rows, dt, order, method, **options).reshape(block.shape)
+    chain.arrays = CHAIN_ARRAYS.get(method, max(CHAIN_ARRAYS.values()))
+    return chain
+
+
+def integration_chain(dt: float, velocity0=0.0, position0=0.0, **options):
+    """
+    Chain that integrates every noisy acceleration twice into a position, as section 3 of
+    pw2 does with rule="rectangle" and bias=None.
+    """
+    def chain(block: np.ndarray) -> np.ndarray:
+        realizations, channels, samples = block.shape
+        rows = block.reshape(-1, samples)
+        v0 = np.broadcast_to(velocity0, (realizations, channels)).ravel()
+        x0 = np.broadcast_to(position0, (realizations, channels)).ravel()
+        _, position = integrate_acceleration(rows, dt, v0, x0, **options)
+        return position.reshape(block.shape)
+    chain.arrays = INTEGRATION_ARRAYS if options.get("highpass_window") is None else HIGHPASS_ARRAYS
+    return chain
+
+
+class _Histograms:
+    """
+    One running histogram of the error per (channel, sample), on bins laid out from a first block.
+
+    The range of each histogram is twice the spread of the first block
+    around its centre; later errors outside it are counted in the end bins,
+    which only matters for percentiles further out than the first block saw.
+    """
+
+    def __init__(self, first: np.ndarray, bins: int):
+        low, high = first.min(axis=0), first.max(axis=0)
+        # Errors that do not vary still get bins, a few ulps wide.
+        ulps = 4 * np.spacing(np.maximum(np.abs(low), np.abs(high))) + np.finfo(float).tiny
+        span = np.maximum(high - low, ulps)
+        self.bins = bins
+        self.low = low - span / 2
+        self.width = 2 * span / bins
+        self.counts = np.zeros(bins * low.size, dtype=np.int64)
+        self.total = 0
+
+    def add(self, error: np.ndarray) -> None:
+        """
+        Count a block of errors, overwriting it.
+        """
+        error -= self.low
+        error /= self.width
+        np.clip(error, 0, self.bins - 1, out=error)
+        index = error.astype(np.intp).reshape(len(error), -1)
+        index *= index.shape[1]
+        index += np.arange(index.shape[1])
+        self.counts += np.bincount(index.ravel(), minlength=self.counts.size)
+        self.total += len(error)
+
+    def percentile(self, q: float) -> np.ndarray:
+        """
+        Percentile q of every histogram, interpolated linearly inside its bin.
+        """
+        counts = self.counts.reshape(self.bins, *self.low.shape)
+        cumulative = np.cumsum(counts, axis=0)
+        # Sample j (from 0) sits at cumulative count j + 1/2, matching the linear np.percentile.
+        target = q / 100 * (self.total - 1) + 0.5
+        k = np.minimum(np.count_nonzero(cumulative < target, axis=0), self.bins - 1)
+        below = np.where(k > 0, np.take_along_axis(cumulative, np.maximum(k - 1, 0)[None], 0)[0], 0)
+        inside = np.take_along_axis(counts, k[None], 0)[0]
+        fraction = np.clip((target - below) / np.maximum(inside, 1), 0.0, 1.0)
+        return self.low + (k + fraction) * self.width
+
+
+def noise_study(clean, reference, chain, loc: float = 0.0, scale: float = 1.0,
+                realizations: int = 1000, percentiles=(5, 50, 95), seed=None,
+                memory_budget: int = DEFAULT_MEMORY_BUDGET, bins: int = HISTOGRAM_BINS) -> NoiseStudy:
+    """
+    Propagate Gaussian noise with an offset through a processing chain.
+
+    The realizations run as one block when the whole study fits in the
+    memory budget, and the percentiles are then exact. Otherwise the
+    budget is shared between per-sample histograms of the error and blocks
+    as large as the rest allows, and the percentiles are read from the
+    histograms.
+
+    Parameters:
+    clean (np.ndarray): Noise-free input, shape (samples,) or (channels, samples).
+    reference (np.ndarray): Exact output of the chain, same shape as its output.
+    chain (callable): Maps a (realizations, channels, samples) block to its output; its
+        arrays attribute is its peak memory in blocks (max(CHAIN_ARRAYS.values()) if missing).
+    loc (float): Offset of the noise.
+    scale (float): Standard deviation of the noise.
+    realizations (int): Number of noisy copies.
+    percentiles (sequence of float): Percentiles of the error to report.
+    seed (int | np.random.SeedSequence | None): Seed of the noise.
+    memory_budget (int): Maximum bytes spent on blocks and histograms.
+    bins (int): Bins of each histogram when the realizations need several blocks, fewer if
+        they would take more than half of the budget.
+
+    Returns:
+    NoiseStudy: RMS, bias and percentile bands of the error over time.
+    """
+    clean = np.atleast_2d(np.asarray(clean, dtype=float))
+    reference = np.atleast_2d(np.asarray(reference, dtype=float))
+    arrays = _STUDY_ARRAYS + getattr(chain, "arrays", max(CHAIN_ARRAYS.values()))
+    realization_bytes = clean.size * 8 * arrays
+    if realizations * realization_bytes <= memory_budget:
+        block_size = realizations
+    else:
+        # The histogram counts and one bincount result take at most half of the budget.
+        bins = min(bins, memory_budget // (2 * 2 * reference.size * 8))
+        block_size = (memory_budget - 2 * bins * reference.size * 8) // realization_bytes
+        if bins < MIN_BINS or block_size < MIN_BLOCK_SIZE:
+            raise ValueError(f"memory_budget of {memory_budget} bytes is too small for this signal")
+    rng = np.random.default_rng(seed)
+
+    error_sum = np.zeros(reference.shape)
+    square_sum = np.zeros(reference.shape)
+    histograms = None
+    done = 0
+    while done < realizations:
+        size = min(block_size, realizations - done)
+        block = rng.normal(loc, scale, (size,) + clean.shape)
+        block += clean
+        error = chain(block)
+        del block
+        error -= reference
+        error_sum += error.sum(axis=0)
+        square_sum += np.einsum("ijk,ijk->jk", error, error)
+        if block_size == realizations:
+            bands = dict(zip(percentiles, np.percentile(error, percentiles, axis=0)))
+        else:
+            histograms = histograms or _Histograms(error, bins)
+            histograms.add(error)
+        done += size
+
+    if histograms is not None:
+        bands = {q: histograms.percentile(q) for q in percentiles}
+    return NoiseStudy(
+        realizations=realizations,
+        rms=np.sqrt(square_sum / realizations),
+        bias=error_sum / realizations,
+        percentiles=bands,
+        exact_percentiles=histograms is None,
+    )
@@ -0,0 +1,193 @@
+"""
+Kalman-filter fusion of noisy position and acceleration measurements.
+
+Sections 2 and 3 of pw2 recover the motion either from the noisy position
+(differentiating twice amplifies the noise) or from the noisy acceleration
+(integrating twice makes the offset drift). A constant-acceleration Kalman
+filter uses both streams at once: the position measurements pin down the
+drift, the acceleration measurements carry the high-frequency motion, and
+an extra state tracks the accelerometer offset.
+
+The state of one axis is [position, velocity, acceleration, accelerometer
+bias]; the acceleration changes by white jerk and the bias by a slow
+random walk.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+
+POSITION, VELOCITY, ACCELERATION, BIAS = range(4)
+
+# Measurement matrix: the position sensor sees the position, the
+# accelerometer sees the acceleration plus its bias.
+H = np.array([[1.0, 0.0, 0.0, 0.0],
+              [0.0, 0.0, 1.0, 1.0]])
+
+
+def transition(dt: float) -> np.ndarray:
+    """
+    State transition of the constant-acceleration model over one step.
+    """
+    return np.array([[1.0, dt, dt ** 2 / 2, 0.0],
+                     [0.0, 1.0, dt, 0.0],
+                     [0.0, 0.0, 1.0, 0.0],
+                     [0.0, 0.0, 0.0, 1.0]])
+
+
+def process_noise(dt: float, jerk_std: float, bias_std: float) -> np.ndarray:
+    """
+    Covariance added over one step by white jerk and a random-walk bias.
+
+    Parameters:
+    dt (float): Time step.
+    jerk_std (float): Spectral density of the jerk, in m/s³/sqrt(Hz).
+    bias_std (float): Spectral density of the bias drift, in m/s²/sqrt(Hz).
+    """
+    q = jerk_std ** 2
+    Q = np.zeros((4, 4))
+    Q[:3, :3] = q * np.array([[dt ** 5 / 20, dt ** 4 / 8, dt ** 3 / 6],
+                              [dt ** 4 / 8, dt ** 3 / 3, dt ** 2 / 2],
+                              [dt ** 3 / 6, dt ** 2 / 2, dt]])
+    Q[BIAS, BIAS] = bias_std ** 2 * dt
+    return Q
+
+
+class KalmanModel:
+
+    def __init__(self, dt: float, position_std: float, acceleration_std: float,
+                 jerk_std: float = 1.0, bias_std: float = 1e-3,
+                 initial_std=(1.0, 10.0, 10.0, 1.0)) -> None:
+        """
+        Matrices of the constant-acceleration model with accelerometer bias.
+
+        Parameters:
+        dt (float): Sampling step in seconds.
+        position_std (float): Noise of the position sensor in m.
+        acceleration_std (float): Noise of the accelerometer in m/s².
+        jerk_std (float): Spectral density of the jerk driving the acceleration.
+        bias_std (float): Spectral density of the bias drift, 0 for a constant bias.
+        initial_std (sequence of float): Prior standard deviation of each state.
+        """
+        self.dt = dt
+        self.F = transition(dt)
+        self.Q = process_noise(dt, jerk_std, bias_std)
+        self.R = np.diag([position_std ** 2, acceleration_std ** 2])
+        self.P0 = np.diag(np.asarray(initial_std, dtype=float) ** 2)
+
+    def initial_state(self, position: float, acceleration: float) -> np.ndarray:
+        x = np.zeros(np.shape(position) + (4,))
+        x[..., POSITION] = np.nan_to_num(position)
+        x[..., ACCELERATION] = np.nan_to_num(acceleration)
+        return x
+
+
+class OnlineKalmanFilter:
+
+    def __init__(self, model: KalmanModel) -> None:
+        """
+        Sample-by-sample filter: every step costs O(1) time and memory.
+
+        Either measurement may be nan, in which case only the other one is
+        used for that step.
+        """
+        self.model = model
+        self.x = None
+        self.P = None
+
+    def step(self, position: float, acceleration: float) -> np.ndarray:
+        """
+        Fuse one pair of measurements and return the state estimate
+        [position, velocity, acceleration, bias].
+        """
+        model = self.model
+        if self.x is None:
+            self.x = model.initial_state(position, acceleration)
+            self.P = model.P0.copy()
+        else:
+            self.x = model.F @ self.x
+            self.P = model.F @ self.P @ model.F.T + model.Q
+
+        z = np.array([position, acceleration], dtype=float)
+        seen = np.isfinite(z)
+        if seen.any():
+            Hs = H[seen]
+            S = Hs @ self.P @ Hs.T + model.R[np.ix_(seen, seen)]
+            K = np.linalg.solve(S, Hs @ self.P).T
+            self.x = self.x + K @ (z[seen] - Hs @ self.x)
+            # Joseph form keeps P symmetric positive definite
+            A = np.eye(4) - K @ Hs
+            self.P = A @ self.P @ A.T + K @ model.R[np.ix_(seen, seen)] @ K.T
+        return self.x.copy()
+
+
+@dataclass
+class FusionResult:
+    """
+    Estimated motion of a batch of trajectories, each array of shape (trajectories, samples).
+    """
+    position: np.ndarray
+    velocity: np.ndarray
+    acceleration: np.ndarray
+    bias: np.ndarray
+
+
+def kalman_filter_batch(positions, accelerations, model: KalmanModel,
+                        smooth: bool = False) -> FusionResult:
+    """
+    Filter (and optionally RTS-smooth) many trajectories at once.
+
+    All trajectories share the model and a complete set of measurements,
+    so they also share the covariance and the gain: each time step costs a
+    few 4x4 products plus one vectorized update of all the states.
+
+    Parameters:
+    positions (np.ndarray): Position measurements, shape (samples,) or (trajectories, samples).
+    accelerations (np.ndarray): Acceleration measurements, same shape.
+    model (KalmanModel): Model matrices.
+    smooth (bool): Run the Rauch–Tung–Striebel smoother backwards after the filter,
+        which uses the future measurements too but keeps every step in memory.
+
+    Returns:
+    FusionResult: Position, velocity, acceleration and bias estimates.
+    """
+    positions = np.atleast_2d(np.asarray(positions, dtype=float))
+    accelerations = np.atleast_2d(np.asarray(accelerations, dtype=float))
+    if positions.shape != accelerations.shape:
+        raise ValueError("positions and accelerations must have the same shape")
+    if not (np.isfinite(positions).all() and np.isfinite(accelerations).all()):
+        raise ValueError("the batched filter needs every measurement, use OnlineKalmanFilter for gaps")
+    M, T = positions.shape
+    F, Q, R = model.F, model.Q, model.R
+
+    states = np.empty((T, M, 4))
+    if smooth:
+        covariances = np.empty((T, 4, 4))
+        predicted = np.empty((T, 4, 4))
+
+    x = model.initial_state(positions[:, 0], accelerations[:, 0])
+    P = model.P0.copy()
+    z = np.empty((M, 2))
+    for k in range(T):
+        if k:
+            x = x @ F.T
+            P = F @ P @ F.T + Q
+        if smooth:
+            predicted[k] = P
+        S = H @ P @ H.T + R
+        K = np.linalg.solve(S, H @ P).T
+        z[:, 0] = positions[:, k]
+        z[:, 1] = accelerations[:, k]
+        x += (z - x @ H.T) @ K.T
+        A = np.eye(4) - K @ H
+        P = A @ P @ A.T + K @ R @ K.T
+        states[k] = x
+        if smooth:
+            covariances[k] = P
+
+    if smooth:
+        for k in range(T - 2, -1, -1):
+            C = np.linalg.solve(predicted[k + 1], F @ covariances[k]).T
+            states[k] += (states[k + 1] - states[k] @ F.T) @ C.T
+
+    return FusionResult(*(states[:, :, i].T.copy() for i in range(4)))
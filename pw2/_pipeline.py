@@ -0,0 +1,182 @@
+"""
+Streaming, bounded-memory version of the pw2 trajectory/noise pipeline.
+
+Signals travel through the pipeline as (channels, samples) chunks. Sources
+generate them chunk by chunk, and every stage keeps just enough state
+between chunks (one or two samples for a derivative, the running total
+for a cumulative sum) to give exactly the numbers the full-array NumPy
+calls give, whatever the chunk size.
+"""
+import numpy as np
+
+from ._signals import sample_count
+
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+def time_chunks(t_start: float, t_end: float, dt: float, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Yield the time axis np.arange(t_start, t_end + dt, dt) in chunks of chunk_size samples.
+    """
+    n = sample_count(t_start, t_end, dt)
+    for first in range(0, n, chunk_size):
+        yield t_start + np.arange(first, min(n, first + chunk_size)) * dt
+
+
+def signal_source(signal, t_start: float, t_end: float, dt: float,
+                  chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Yield signal(t) chunk by chunk, each chunk of shape (channels, samples).
+
+    Parameters:
+    signal (callable): Maps a time array to an array of shape (channels, len(t)).
+    t_start, t_end (float): Time range in seconds, both ends included.
+    dt (float): Sampling step in seconds.
+    chunk_size (int): Samples per chunk.
+    """
+    for t in time_chunks(t_start, t_end, dt, chunk_size):
+        yield np.atleast_2d(signal(t))
+
+
+def array_source(signal, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Yield a stored (channels, samples) signal chunk by chunk, for instance a
+    memory map opened with load_signal, reading one chunk from disk at a time.
+    """
+    signal = np.atleast_2d(signal)
+    for first in range(0, signal.shape[-1], chunk_size):
+        yield np.asarray(signal[:, first:first + chunk_size], dtype=float)
+
+
+class AddNoise:
+
+    def __init__(self, loc: float, scale: float, channels: int, seed=None) -> None:
+        """
+        Add Gaussian noise with an offset to every channel.
+
+        Each channel draws from its own child stream of the seed, so the
+        noise of a channel does not depend on how the signal is chunked.
+
+        Parameters:
+        loc (float): Offset (mean of the noise).
+        scale (float): Standard deviation of the noise.
+        channels (int): Number of channels of the signal.
+        seed (int | np.random.SeedSequence | None): Seed of the noise.
+        """
+        self.loc = loc
+        self.scale = scale
+        root = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        self.rngs = [np.random.default_rng(child) for child in root.spawn(channels)]
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        noisy = np.array(chunk, dtype=float)
+        for row, rng in zip(noisy, self.rngs):
+            row += rng.normal(self.loc, self.scale, row.shape)
+        return noisy
+
+    def flush(self) -> np.ndarray:
+        return np.empty((len(self.rngs), 0))
+
+
+class Gradient:
+
+    def __init__(self, dt: float) -> None:
+        """
+        Streaming equivalent of np.gradient(signal, dt, axis=-1).
+
+        Central differences need the next sample, so every output lags the
+        input by one sample; flush() emits the last one with the one-sided
+        end formula, exactly as np.gradient does.
+
+        Parameters:
+        dt (float): Sampling step.
+        """
+        self.dt = dt
+        self.tail = None
+        self.started = False
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        chunk = np.asarray(chunk, dtype=float)
+        if self.tail is None:
+            self.tail = chunk[:, :0]
+        signal = np.concatenate([self.tail, chunk], axis=1)
+        outputs = []
+        if not self.started and signal.shape[1] >= 2:
+            outputs.append((signal[:, 1:2] - signal[:, 0:1]) / self.dt)
+            self.started = True
+        if signal.shape[1] >= 3:
+            outputs.append((signal[:, 2:] - signal[:, :-2]) / (2. * self.dt))
+        if self.started:
+            self.tail = signal[:, -2:]
+        else:
+            self.tail = signal
+        return np.concatenate(outputs, axis=1) if outputs else signal[:, :0]
+
+    def flush(self) -> np.ndarray:
+        if self.tail is None or self.tail.shape[1] < 2:
+            raise ValueError("np.gradient needs at least two samples")
+        last = (self.tail[:, -1:] - self.tail[:, -2:-1]) / self.dt
+        self.tail = None
+        self.started = False
+        return last
+
+
+class CumulativeSum:
+
+    def __init__(self, dt: float = 1.0) -> None:
+        """
+        Streaming equivalent of np.cumsum(signal, axis=-1) * dt.
+
+        The running total of the previous chunk is added to the first sample
+        of the next one before summing, so the additions happen in the same
+        order as over the full array.
+
+        Parameters:
+        dt (float): Factor applied to the sums, the sampling step for rectangle integration.
+        """
+        self.dt = dt
+        self.total = None
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        sums = np.array(chunk, dtype=float)
+        if sums.shape[1] == 0:
+            return sums
+        if self.total is not None:
+            sums[:, 0] += self.total
+        np.cumsum(sums, axis=1, out=sums)
+        self.total = sums[:, -1].copy()
+        sums *= self.dt
+        return sums
+
+    def flush(self) -> np.ndarray:
+        channels = 0 if self.total is None else self.total.shape[0]
+        self.total = None
+        return np.empty((channels, 0))
+
+
+def run_pipeline(source, *stages):
+    """
+    Push the chunks of source through the stages and yield what comes out.
+
+    When the source is exhausted every stage is flushed in turn and its
+    remaining samples go through the stages after it.
+
+    Parameters:
+    source (iterable of np.ndarray): Chunks of shape (channels, samples).
+    stages: Objects with process(chunk) and flush() methods.
+
+    Yields:
+    np.ndarray: Output chunks, possibly empty, in sample order.
+    """
+    for chunk in source:
+        for stage in stages:
+            chunk = stage.process(chunk)
+        if chunk.shape[1]:
+            yield chunk
+    for i, stage in enumerate(stages):
+        chunk = stage.flush()
+        for later in stages[i + 1:]:
+            chunk = later.process(chunk)
+        if chunk.shape[1]:
+            yield chunk
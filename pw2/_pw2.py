@@ -1,9 +1,12 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from plotutils import plot_decimated
+from pw2 import generate_to_npy, load_signal
 import os
 
-# Ensure the ./data directory exists
-os.makedirs('./pw2/data', exist_ok=True)
+# Ensure the data directory next to this script exists
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+os.makedirs(DATA_DIR, exist_ok=True)
 
 # Set the random seed for reproducibility
 np.random.seed(42)
@@ -16,8 +19,9 @@ t = np.arange(t_start, t_end + dt, dt)
 
 # Question 1: Trajectory Generation
 # 1.a. Compute position coordinates
-x = 50 * np.sin(0.1 * np.pi * t)
-y = 50 * np.sin(0.2 * np.pi * t)
+# Generated once into DATA_DIR and read back zero-copy by the later sections
+generate_to_npy(os.path.join(DATA_DIR, 'trajectory.npy'), 'trajectory', t_start, t_end, dt, dtype=np.float64)
+x, y = load_signal(os.path.join(DATA_DIR, 'trajectory.npy'))
 
 # Plotting the trajectory
 plt.figure(figsize=(8, 6))
@@ -28,24 +32,24 @@ plt.ylabel('y(t) [meters]')
 plt.legend()
 plt.grid(True)
 plt.axis('equal')  # Equal scaling for both axes
-plt.savefig('./data/trajectory.png')
+plt.savefig(os.path.join(DATA_DIR, 'trajectory.png'))
 plt.close()  # Close the plot instead of showing it
 
 # 1.b. Compute acceleration
 # Given acceleration equations
-a_x = -0.5 * np.pi**2 * np.sin(0.1 * np.pi * t)
-a_y = -2 * np.pi**2 * np.sin(0.2 * np.pi * t)
+generate_to_npy(os.path.join(DATA_DIR, 'acceleration.npy'), 'acceleration', t_start, t_end, dt, dtype=np.float64)
+a_x, a_y = load_signal(os.path.join(DATA_DIR, 'acceleration.npy'))
 
 # Plotting the acceleration
 plt.figure(figsize=(8, 6))
-plt.plot(t, a_x, label='Acceleration a_x(t)', color='red')
-plt.plot(t, a_y, label='Acceleration a_y(t)', color='green')
+plot_decimated(t, a_x, label='Acceleration a_x(t)', color='red')
+plot_decimated(t, a_y, label='Acceleration a_y(t)', color='green')
 plt.title('Acceleration Components over Time')
 plt.xlabel('Time [seconds]')
 plt.ylabel('Acceleration [m/s²]')
 plt.legend()
 plt.grid(True)
-plt.savefig('./pw2/data/acceleration.png')
+plt.savefig(os.path.join(DATA_DIR, 'acceleration.png'))
 plt.close()
 
 # Question 2: From Position to Acceleration
@@ -63,22 +67,22 @@ a_y_noisy = np.gradient(dy_dt, dt)
 
 # Plotting the noisy accelerations
 plt.figure(figsize=(8, 6))
-plt.plot(t, a_x_noisy, label='Noisy a_x(t)', color='purple')
-plt.plot(t, a_y_noisy, label='Noisy a_y(t)', color='orange')
+plot_decimated(t, a_x_noisy, label='Noisy a_x(t)', color='purple')
+plot_decimated(t, a_y_noisy, label='Noisy a_y(t)', color='orange')
 plt.title('Noisy Acceleration Components over Time')
 plt.xlabel('Time [seconds]')
 plt.ylabel('Acceleration [m/s²]')
 plt.legend()
 plt.grid(True)
-plt.savefig('./pw2/data/noisy_acceleration.png')
+plt.savefig(os.path.join(DATA_DIR, 'noisy_acceleration.png'))
 plt.close()
 
 # 2.c. Assessing the Impact of Noise and Offset
 # Comparison of ideal vs noisy acceleration
 plt.figure(figsize=(10, 8))
 plt.subplot(2, 1, 1)
-plt.plot(t, a_x, label='Ideal a_x(t)', color='red')
-plt.plot(t, a_x_noisy, label='Noisy a_x(t)', color='purple', alpha=0.5)
+plot_decimated(t, a_x, label='Ideal a_x(t)', color='red')
+plot_decimated(t, a_x_noisy, label='Noisy a_x(t)', color='purple', alpha=0.5)
 plt.title('Comparison of Ideal and Noisy Acceleration a_x(t)')
 plt.xlabel('Time [seconds]')
 plt.ylabel('Acceleration [m/s²]')
@@ -86,15 +90,15 @@ plt.legend()
 plt.grid(True)
 
 plt.subplot(2, 1, 2)
-plt.plot(t, a_y, label='Ideal a_y(t)', color='green')
-plt.plot(t, a_y_noisy, label='Noisy a_y(t)', color='orange', alpha=0.5)
+plot_decimated(t, a_y, label='Ideal a_y(t)', color='green')
+plot_decimated(t, a_y_noisy, label='Noisy a_y(t)', color='orange', alpha=0.5)
 plt.title('Comparison of Ideal and Noisy Acceleration a_y(t)')
 plt.xlabel('Time [seconds]')
 plt.ylabel('Acceleration [m/s²]')
 plt.legend()
 plt.grid(True)
 plt.tight_layout()
-plt.savefig('./pw2/data/comparison_acceleration.png')
+plt.savefig(os.path.join(DATA_DIR, 'comparison_acceleration.png'))
 plt.close()
 
 # Question 3: From Acceleration to Position
@@ -111,22 +115,22 @@ y_position_noisy = np.cumsum(a_y_noisy_2) * dt
 
 # Plotting the noisy positions
 plt.figure(figsize=(8, 6))
-plt.plot(t, x_position_noisy, label='Noisy x(t)', color='cyan')
-plt.plot(t, y_position_noisy, label='Noisy y(t)', color='magenta')
+plot_decimated(t, x_position_noisy, label='Noisy x(t)', color='cyan')
+plot_decimated(t, y_position_noisy, label='Noisy y(t)', color='magenta')
 plt.title('Noisy Position Components over Time')
 plt.xlabel('Time [seconds]')
 plt.ylabel('Position [meters]')
 plt.legend()
 plt.grid(True)
-plt.savefig('./data/noisy_position.png')
+plt.savefig(os.path.join(DATA_DIR, 'noisy_position.png'))
 plt.close()
 
 # 3.c. Assessing the Impact of Noise and Offset
 # Comparison of ideal vs noisy position
 plt.figure(figsize=(10, 8))
 plt.subplot(2, 1, 1)
-plt.plot(t, x, label='Ideal x(t)', color='blue')
-plt.plot(t, x_position_noisy, label='Noisy x(t)', color='cyan', alpha=0.5)
+plot_decimated(t, x, label='Ideal x(t)', color='blue')
+plot_decimated(t, x_position_noisy, label='Noisy x(t)', color='cyan', alpha=0.5)
 plt.title('Comparison of Ideal and Noisy Position x(t)')
 plt.xlabel('Time [seconds]')
 plt.ylabel('Position [meters]')
@@ -134,13 +138,13 @@ plt.legend()
 plt.grid(True)
 
 plt.subplot(2, 1, 2)
-plt.plot(t, y, label='Ideal y(t)', color='orange')
-plt.plot(t, y_position_noisy, label='Noisy y(t)', color='magenta', alpha=0.5)
+plot_decimated(t, y, label='Ideal y(t)', color='orange')
+plot_decimated(t, y_position_noisy, label='Noisy y(t)', color='magenta', alpha=0.5)
 plt.title('Comparison of Ideal and Noisy Position y(t)')
 plt.xlabel('Time [seconds]')
 plt.ylabel('Position [meters]')
 plt.legend()
 plt.grid(True)
 plt.tight_layout()
-plt.savefig('./data/comparison_position.png')
+plt.savefig(os.path.join(DATA_DIR, 'comparison_position.png'))
 plt.close()
\ No newline at end of file
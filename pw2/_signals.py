@@ -0,0 +1,139 @@
+"""
+Reusable generators for the pw2 car signals, with dtype control, out= buffers
+and .npy memory-mapped storage.
+
+Every generator fills its output in place with a handful of ufunc calls,
+so the only arrays allocated are the result (or nothing when out is given)
+and a float64 scratch buffer of at most DEFAULT_CHUNK_SIZE samples.
+generate_to_npy writes a signal chunk by chunk into a .npy file opened as
+a memory map; downstream stages then open it with load_signal and read it
+without copying or recomputing it.
+"""
+import numpy as np
+from numpy.lib.format import open_memmap
+
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# (amplitude, angular frequency) of each channel of each signal.
+SIGNALS = {
+    "trajectory": [(50.0, 0.1 * np.pi), (50.0, 0.2 * np.pi)],
+    "acceleration": [(-0.5 * np.pi**2, 0.1 * np.pi), (-2 * np.pi**2, 0.2 * np.pi)],
+}
+
+
+def _output(shape: tuple, dtype, out: np.ndarray | None) -> np.ndarray:
+    if out is None:
+        return np.empty(shape, dtype=dtype or np.float64)
+    if out.shape != shape:
+        raise ValueError(f"out has shape {out.shape}, expected {shape}")
+    return out
+
+
+def sample_count(t_start: float, t_end: float, dt: float) -> int:
+    """
+    Number of samples of np.arange(t_start, t_end + dt, dt).
+    """
+    return int(np.ceil((t_end + dt - t_start) / dt))
+
+
+def time_axis(t_start: float, t_end: float, dt: float, dtype=None,
+              out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Same samples as np.arange(t_start, t_end + dt, dt), in the requested dtype or buffer.
+    """
+    n = sample_count(t_start, t_end, dt)
+    out = _output((n,), dtype, out)
+    out[:] = np.arange(n)
+    out *= dt
+    out += t_start
+    return out
+
+
+def sine_signal(name: str, t, dtype=None, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Evaluate one of the SIGNALS at times t, shape (channels, len(t)).
+
+    The phase and the sine are computed in float64, a chunk at a time in a
+    scratch buffer, and rounded to the output dtype once, so float32
+    outputs stay accurate to their own precision over long runs.
+
+    Parameters:
+    name (str): "trajectory" or "acceleration".
+    t (np.ndarray): Times in seconds.
+    dtype (np.dtype | None): Output dtype when out is None, float64 by default.
+    out (np.ndarray | None): Preallocated result of shape (channels, len(t)).
+
+    Returns:
+    np.ndarray: The signal, the same object as out when given.
+    """
+    if name not in SIGNALS:
+        raise ValueError(f"Unknown signal {name!r}, expected one of {sorted(SIGNALS)}")
+    t = np.asarray(t)
+    channels = SIGNALS[name]
+    out = _output((len(channels),) + t.shape, dtype, out)
+    n = len(t)
+    scratch = np.empty(min(n, DEFAULT_CHUNK_SIZE))
+    for row, (amplitude, omega) in zip(out, channels):
+        for first in range(0, n, DEFAULT_CHUNK_SIZE):
+            last = min(n, first + DEFAULT_CHUNK_SIZE)
+            phase = scratch[:last - first]
+            np.multiply(t[first:last], omega, out=phase)
+            np.sin(phase, out=phase)
+            phase *= amplitude
+            row[first:last] = phase
+    return out
+
+
+def trajectory(t, dtype=None, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Position of the car (x, y) in meters, as in question 1.a.
+    """
+    return sine_signal("trajectory", t, dtype, out)
+
+
+def acceleration(t, dtype=None, out: np.ndarray | None = None) -> np.ndarray:
+    """
+    Acceleration of the car (a_x, a_y) in m/s², as in question 1.b.
+    """
+    return sine_signal("acceleration", t, dtype, out)
+
+
+def generate_to_npy(path: str, name: str, t_start: float, t_end: float, dt: float,
+                    dtype=np.float32, chunk_size: int = DEFAULT_CHUNK_SIZE) -> np.memmap:
+    """
+    Generate a signal into a .npy memory map, one chunk of samples at a time.
+
+    Memory use is bounded by the chunk size however long the recording is.
+
+    Parameters:
+    path (str): Destination .npy file, overwritten.
+    name (str): "trajectory" or "acceleration".
+    t_start, t_end (float): Time range in seconds, both ends included.
+    dt (float): Sampling step in seconds.
+    dtype (np.dtype): Dtype stored in the file.
+    chunk_size (int): Samples generated at once.
+
+    Returns:
+    np.memmap: The written signal, shape (channels, samples), opened read-write.
+    """
+    n = sample_count(t_start, t_end, dt)
+    signal = open_memmap(path, mode="w+", dtype=dtype, shape=(len(SIGNALS[name]), n))
+    t = np.empty(min(n, chunk_size))
+    for first in range(0, n, chunk_size):
+        last = min(n, first + chunk_size)
+        chunk_t = t[:last - first]
+        chunk_t[:] = np.arange(first, last)
+        chunk_t *= dt
+        chunk_t += t_start
+        # Each chunk is computed in float64 and rounded once into the file.
+        signal[:, first:last] = sine_signal(name, chunk_t)
+    signal.flush()
+    return signal
+
+
+def load_signal(path: str, mode: str = "r") -> np.memmap:
+    """
+    Open a signal saved by generate_to_npy (or np.save) as a zero-copy memory map.
+    """
+    return np.load(path, mmap_mode=mode)
@@ -0,0 +1,36 @@
+from ._pendulum import EnsembleSolution
+from ._pendulum import double_pendulum
+from ._pendulum import double_pendulum_energy
+from ._pendulum import double_pendulum_jacobian
+from ._pendulum import dopri5
+from ._pendulum import grid_initial_conditions
+from ._pendulum import integrate_ensemble
+from ._pendulum import rk4
+from ._pendulum import rk4_step
+from ._pendulum import second_mass_position
+from ._pendulum import simple_pendulum
+from ._pendulum import simple_pendulum_jacobian
+from ._pendulum import solve_ivp_ensemble
+from ._symplectic import SymplecticSolution
+from ._symplectic import simple_pendulum_acceleration
+from ._symplectic import simple_pendulum_potential
+from ._symplectic import symplectic_integrate
+from ._sweep import load_sweep
+from ._sweep import run_tile
+from ._sweep import sweep
+from ._linear import LinearSystem
+from ._linear import rc_circuit
+from ._linear import rc_ladder
+from ._linear import rlc_series
+from ._period import pendulum_period
+from ._period import period_cross_check
+from ._period import period_from_events
+from ._period import small_angle_period
+from ._benchmark import BenchmarkRecord
+from ._benchmark import benchmark
+from ._benchmark import compare_runs
+from ._chaos import PoincareSection
+from ._chaos import lyapunov_exponents
+from ._chaos import lyapunov_map
+from ._chaos import poincare_map
+from ._chaos import poincare_section
@@ -0,0 +1,54 @@
+"""
+Benchmark the solve_ivp methods on the pw3 models and compare benchmark runs.
+
+Usage:
+    python -m pw3 benchmark --json baseline.json --plot work_precision.png
+    python -m pw3 compare baseline.json run.json --threshold 0.1
+"""
+import argparse
+import sys
+
+from benchutils import add_compare_parser, print_regressions
+
+from ._benchmark import (DEFAULT_METHODS, DEFAULT_RTOLS, KEY, benchmark, compare_runs, default_problems,
+                         plot_work_precision, print_records, read_json, write_json)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m pw3", description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("benchmark", help="benchmark the solvers")
+    run.add_argument("--problems", nargs="+", help="problems to solve (default: all)")
+    run.add_argument("--methods", nargs="+", default=DEFAULT_METHODS, help="solve_ivp methods")
+    run.add_argument("--rtol", type=float, nargs="+", default=DEFAULT_RTOLS, help="relative tolerances")
+    run.add_argument("--warmups", type=int, default=1)
+    run.add_argument("--repeats", type=int, default=3)
+    run.add_argument("--json", help="write the records to this JSON file")
+    run.add_argument("--plot", help="save the work-precision diagrams to this image")
+
+    add_compare_parser(commands)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "benchmark":
+        problems = default_problems()
+        if args.problems:
+            unknown = set(args.problems) - set(problems)
+            if unknown:
+                parser.error(f"unknown problems {sorted(unknown)}, expected some of {sorted(problems)}")
+            problems = {name: problems[name] for name in args.problems}
+        records = benchmark(problems, args.methods, args.rtol, args.warmups, args.repeats)
+        print_records(records)
+        if args.json:
+            write_json(records, args.json)
+        if args.plot:
+            plot_work_precision(records, args.plot)
+        return 0
+
+    regressions = compare_runs(read_json(args.baseline), read_json(args.current), args.threshold)
+    return print_regressions(regressions, KEY)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
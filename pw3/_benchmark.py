@@ -0,0 +1,262 @@
+"""
+Accuracy-versus-cost benchmark of the solve_ivp methods on the pw3 models.
+
+Every (problem, method, rtol) combination is timed with warm-ups and
+repeats, and its final state is compared with an exact solution (RC
+circuit, simple pendulum through Jacobi elliptic functions) or with a
+tight DOP853 reference (double pendulum). Radau, BDF and LSODA get the
+analytic Jacobians of the models. The records are saved as a JSON baseline
+that later runs are compared against, and plotted as work-precision
+diagrams.
+"""
+import statistics
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import scipy
+from scipy.integrate import solve_ivp
+from scipy.special import ellipj, ellipk
+
+import benchutils
+
+from ._linear import rc_circuit
+from ._pendulum import (G, double_pendulum, double_pendulum_jacobian, simple_pendulum,
+                        simple_pendulum_jacobian)
+
+
+DEFAULT_METHODS = ["RK45", "DOP853", "Radau", "BDF", "LSODA"]
+DEFAULT_RTOLS = [1e-3, 1e-4, 1e-5, 1e-6, 1e-7, 1e-8, 1e-9, 1e-10]
+
+# Absolute tolerance of every run, relative to its rtol.
+ATOL_RATIO = 1e-3
+
+IMPLICIT_METHODS = {"Radau", "BDF", "LSODA"}
+
+# Fields identifying a record, and the metrics compared between runs.
+KEY = ("problem", "method", "rtol")
+METRICS = ("time_ns_median", "nfev", "error")
+
+
+@dataclass
+class BenchmarkRecord:
+    """
+    Cost and accuracy of one solve_ivp method on one problem at one tolerance.
+
+    Attributes:
+    problem (str): Name of the problem.
+    method (str): solve_ivp method.
+    rtol (float): Relative tolerance (atol is rtol * ATOL_RATIO).
+    nfev (int): Number of right-hand side evaluations.
+    njev (int): Number of Jacobian evaluations.
+    nlu (int): Number of LU decompositions.
+    repeats (int): Number of timed runs.
+    time_ns_min (int): Fastest run in nanoseconds.
+    time_ns_median (int): Median run in nanoseconds.
+    error (float): Largest absolute error of the final state.
+    """
+    problem: str
+    method: str
+    rtol: float
+    nfev: int
+    njev: int
+    nlu: int
+    repeats: int
+    time_ns_min: int
+    time_ns_median: int
+    error: float
+
+
+class Problem:
+
+    def __init__(self, name: str, fun, jac, t_span: tuple, y0, reference) -> None:
+        """
+        An initial value problem with a known final state.
+
+        Parameters:
+        name (str): Name of the problem.
+        fun (callable): Right-hand side fun(t, y).
+        jac (callable): Jacobian jac(t, y) of fun.
+        t_span (tuple[float, float]): Start and end time.
+        y0 (sequence of float): Initial state.
+        reference (callable): Returns the exact (or reference) state at t_span[1].
+        """
+        self.name = name
+        self.fun = fun
+        self.jac = jac
+        self.t_span = t_span
+        self.y0 = np.asarray(y0, dtype=float)
+        self.reference = lru_cache(maxsize=1)(reference)
+
+
+def rc_problem(R: float = 1000, C: float = 1e-9, Vin: float = 5.0, t_end: float = 10e-6) -> Problem:
+    """
+    Charging of the RC circuit of pw3, exact solution Vin (1 - exp(-t / RC)).
+    """
+    system = rc_circuit(R, C)
+
+    def fun(t, y):
+        return system.A @ y + system.B[:, 0] * Vin
+
+    return Problem("rc", fun, lambda t, y: system.A, (0.0, t_end), [0.0],
+                   lambda: np.array([Vin * -np.expm1(-t_end / (R * C))]))
+
+
+def simple_pendulum_problem(theta0: float = np.radians(75), L: float = 0.2, g: float = G,
+                            t_end: float = 10.0) -> Problem:
+    """
+    Simple pendulum released from rest, exact solution theta = 2 arcsin(k sn(K - w t | k²)).
+    """
+    def exact():
+        k = np.sin(theta0 / 2)
+        omega = np.sqrt(g / L)
+        sn, cn, _, _ = ellipj(ellipk(k ** 2) - omega * t_end, k ** 2)
+        return np.array([2 * np.arcsin(k * sn), -2 * k * omega * cn])
+
+    return Problem("simple_pendulum", lambda t, y: simple_pendulum(t, y, L, g),
+                   lambda t, y: simple_pendulum_jacobian(t, y, L, g), (0.0, t_end), [theta0, 0.0], exact)
+
+
+def double_pendulum_problem(theta1: float = np.radians(30), theta2: float = 0.0, L: float = 1.0,
+                            g: float = G, t_end: float = 10.0) -> Problem:
+    """
+    Double pendulum released from rest, referenced against DOP853 at rtol = atol = 1e-13.
+    """
+    y0 = [theta1, 0.0, theta2, 0.0]
+
+    def fun(t, y):
+        return double_pendulum(t, y, L, g)
+
+    def reference():
+        return solve_ivp(fun, (0.0, t_end), y0, method="DOP853", rtol=1e-13, atol=1e-13).y[:, -1]
+
+    return Problem("double_pendulum", fun, lambda t, y: double_pendulum_jacobian(t, y, L, g),
+                   (0.0, t_end), y0, reference)
+
+
+def default_problems() -> dict:
+    """
+    The RC, simple-pendulum and double-pendulum problems of pw3.
+    """
+    return {problem.name: problem for problem in (rc_problem(), simple_pendulum_problem(),
+                                                   double_pendulum_problem())}
+
+
+def benchmark_run(problem: Problem, method: str, rtol: float, warmups: int = 1,
+                  repeats: int = 3) -> BenchmarkRecord:
+    """
+    Time one solve_ivp method on a problem and measure the error of its final state.
+
+    Parameters:
+    problem (Problem): Problem to solve.
+    method (str): solve_ivp method; the implicit ones get the analytic Jacobian.
+    rtol (float): Relative tolerance, atol being rtol * ATOL_RATIO.
+    warmups (int): Untimed runs before the timed ones.
+    repeats (int): Number of timed runs.
+
+    Returns:
+    BenchmarkRecord: Counts, timings and error.
+    """
+    options = {"method": method, "rtol": rtol, "atol": rtol * ATOL_RATIO}
+    if method in IMPLICIT_METHODS:
+        options["jac"] = problem.jac
+
+    def solve():
+        return solve_ivp(problem.fun, problem.t_span, problem.y0, **options)
+
+    for _ in range(warmups):
+        solve()
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        solution = solve()
+        times.append(time.perf_counter_ns() - start)
+    if not solution.success:
+        raise RuntimeError(f"{method} failed on {problem.name} at rtol={rtol}: {solution.message}")
+
+    error = float(np.max(np.abs(solution.y[:, -1] - problem.reference())))
+    return BenchmarkRecord(problem.name, method, rtol, int(solution.nfev), int(solution.njev),
+                           int(solution.nlu), repeats, min(times), int(statistics.median(times)), error)
+
+
+def benchmark(problems: dict | None = None, methods=DEFAULT_METHODS, rtols=DEFAULT_RTOLS,
+              warmups: int = 1, repeats: int = 3) -> list:
+    """
+    Run every method at every tolerance on every problem.
+
+    Parameters:
+    problems (dict | None): Name -> Problem, defaults to default_problems().
+    methods (iterable of str): solve_ivp methods.
+    rtols (iterable of float): Relative tolerances.
+    warmups (int): Untimed runs before the timed ones.
+    repeats (int): Number of timed runs.
+
+    Returns:
+    list[BenchmarkRecord]: One record per problem, method and tolerance.
+    """
+    problems = problems or default_problems()
+    return [benchmark_run(problem, method, rtol, warmups, repeats)
+            for problem in problems.values() for method in methods for rtol in rtols]
+
+
+def write_json(records: list, path: str) -> None:
+    """
+    Save the records and the platform they were measured on.
+    """
+    benchutils.write_json(records, path, {"scipy": scipy.__version__})
+
+
+def read_json(path: str) -> list:
+    """
+    Load the records saved by write_json.
+    """
+    return benchutils.read_json(path, BenchmarkRecord)
+
+
+def compare_runs(baseline: list, current: list, threshold: float = 0.10) -> list:
+    """
+    Flag the measurements of current that got worse than baseline.
+
+    The METRICS of every (problem, method, rtol) present in both runs are
+    compared with benchutils.compare_runs; errors below 1e-14 are rounding
+    and are not compared.
+
+    Returns:
+    list[dict]: One entry per regression with problem, method, rtol, metric, both values and their ratio.
+    """
+    return benchutils.compare_runs(baseline, current, KEY, METRICS, threshold, {"error": 1e-14})
+
+
+def plot_work_precision(records: list, path: str) -> None:
+    """
+    Save work-precision diagrams, error against median time, one panel per problem.
+    """
+    import matplotlib.pyplot as plt
+
+    problems = list(dict.fromkeys(record.problem for record in records))
+    fig, axes = plt.subplots(1, len(problems), figsize=(6 * len(problems), 5), squeeze=False)
+    for ax, problem in zip(axes[0], problems):
+        selected = [record for record in records if record.problem == problem]
+        for method in dict.fromkeys(record.method for record in selected):
+            points = [(record.time_ns_median / 1e6, max(record.error, 1e-17))
+                      for record in selected if record.method == method]
+            ax.loglog(*zip(*points), marker='o', label=method)
+        ax.set_title(f'Work-Precision ({problem})')
+        ax.set_xlabel('Median time (ms)')
+        ax.set_ylabel('Error of the final state')
+        ax.grid(True, which='both', alpha=0.3)
+        ax.legend()
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+
+
+def print_records(records: list) -> None:
+    print(f"{'Problem':>16} | {'Method':>6} | {'rtol':>7} | {'nfev':>7} | {'njev':>5} | {'nlu':>5} | "
+          f"{'Median (ms)':>11} | {'Error':>11}")
+    print("-" * 92)
+    for record in records:
+        print(f"{record.problem:>16} | {record.method:>6} | {record.rtol:>7.0e} | {record.nfev:>7} | "
+              f"{record.njev:>5} | {record.nlu:>5} | {record.time_ns_median / 1e6:>11.3f} | {record.error:>11.3e}")
+    print("-" * 92)
@@ -0,0 +1,276 @@
+"""
+Lyapunov exponents and Poincaré sections of the double pendulum, for whole ensembles.
+
+The Lyapunov exponents come from the variational equations d' = J(y) d,
+integrated with RK4 alongside the states for k tangent vectors per
+trajectory. Every renormalize_every steps the tangent vectors are
+re-orthonormalized by a batched QR decomposition and the logarithms of the
+diagonal of R are accumulated; their time averages are the k largest
+exponents.
+
+The Poincaré recorder steps the ensemble with RK4 and, on every step where
+theta1 crosses 0 upwards (omega1 > 0), locates the crossing on the cubic
+Hermite interpolant of the step and stores the interpolated state.
+
+lyapunov_map and poincare_map spread a (theta1, theta2) grid over a
+process pool in tiles; poincare_map stores the sections in .npy memory
+maps, like sweep.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from ._pendulum import G, double_pendulum, double_pendulum_jacobian, grid_initial_conditions, rk4_step
+from ._sweep import DEFAULT_TILE_SHAPE, tile_slices
+
+
+# Files of a poincare_map directory: points, times and counts of the PoincareSection.
+POINCARE_FILES = ("points.npy", "times.npy", "counts.npy")
+
+
+def _variational(t, z, L, g):
+    # z stacks the states (4, M) and k tangent vectors (4, k, M) as (4 + 4 k, M)
+    y = z[:4]
+    tangents = z[4:].reshape(4, -1, z.shape[-1])
+    dz = np.empty_like(z)
+    dz[:4] = double_pendulum(t, y, L, g)
+    J = double_pendulum_jacobian(t, y, L, g)
+    dz[4:] = np.einsum("ijm,jkm->ikm", J, tangents).reshape(-1, z.shape[-1])
+    return dz
+
+
+def lyapunov_exponents(y0, t_end: float, h: float = 1e-2, n_exponents: int = 1,
+                       renormalize_every: int = 10, transient: float = 0.0,
+                       L: float = 1.0, g: float = G) -> np.ndarray:
+    """
+    Largest Lyapunov exponents of an ensemble of double pendulum trajectories.
+
+    Parameters:
+    y0 (np.ndarray): Initial states [theta1, omega1, theta2, omega2], shape (4, M).
+    t_end (float): Averaging time in seconds, after the transient.
+    h (float): RK4 step in seconds.
+    n_exponents (int): Number of exponents, from 1 to 4.
+    renormalize_every (int): Steps between two QR re-orthonormalizations.
+    transient (float): Time integrated first, without accumulating, so the
+        tangent vectors align with the dominant directions.
+    L (float): Length of both rods in meters.
+    g (float): Acceleration due to gravity in m/s².
+
+    Returns:
+    np.ndarray: Exponents in 1/s, largest first, shape (n_exponents, M).
+    """
+    if not 1 <= n_exponents <= 4:
+        raise ValueError("n_exponents must be between 1 and 4")
+    y0 = np.asarray(y0, dtype=float)
+    M = y0.shape[1]
+    z = np.empty((4 + 4 * n_exponents, M))
+    z[:4] = y0
+    z[4:] = np.broadcast_to(np.eye(4)[:, :n_exponents, None], (4, n_exponents, M)).reshape(-1, M)
+
+    log_sums = np.zeros((n_exponents, M))
+    transient_steps = int(round(transient / h))
+    n_steps = int(round(t_end / h))
+    total = transient_steps + n_steps
+    for step in range(1, total + 1):
+        rk4_step(_variational, (step - 1) * h, z, h, (L, g))
+        if step % renormalize_every == 0 or step in (transient_steps, total):
+            tangents = z[4:].reshape(4, n_exponents, M).transpose(2, 0, 1)
+            Q, R = np.linalg.qr(tangents)
+            # The sign of Q is free; make diag(R) positive so Q keeps the orientation.
+            signs = np.sign(np.diagonal(R, axis1=1, axis2=2))
+            signs[signs == 0] = 1
+            Q *= signs[:, None, :]
+            if step > transient_steps:
+                log_sums += np.log(np.abs(np.diagonal(R, axis1=1, axis2=2))).T
+            z[4:] = Q.transpose(1, 2, 0).reshape(-1, M)
+    return log_sums / (n_steps * h)
+
+
+def _lyapunov_tile(theta1, theta2, t_end, h, n_exponents, renormalize_every, transient, L, g):
+    y0 = grid_initial_conditions(theta1, theta2)
+    exponents = lyapunov_exponents(y0, t_end, h, n_exponents, renormalize_every, transient, L, g)
+    return exponents.reshape(n_exponents, len(theta1), len(theta2))
+
+
+def lyapunov_map(theta1, theta2, t_end: float, h: float = 1e-2, n_exponents: int = 1,
+                 renormalize_every: int = 10, transient: float = 0.0,
+                 tile_shape: tuple = DEFAULT_TILE_SHAPE, workers: int | None = None,
+                 L: float = 1.0, g: float = G) -> np.ndarray:
+    """
+    Lyapunov exponents over the grid theta1 x theta2 of initial angles at rest, tiles in a process pool.
+
+    Returns:
+    np.ndarray: Exponents in 1/s, shape (n_exponents, len(theta1), len(theta2)).
+    """
+    theta1 = np.asarray(theta1, dtype=float)
+    theta2 = np.asarray(theta2, dtype=float)
+    tiles = tile_slices((len(theta1), len(theta2)), tile_shape)
+    result = np.empty((n_exponents, len(theta1), len(theta2)))
+    tasks = [(theta1[rows], theta2[columns], t_end, h, n_exponents, renormalize_every, transient, L, g)
+             for rows, columns in tiles]
+
+    workers = min(workers or os.cpu_count() or 1, len(tiles))
+    if workers == 1:
+        outputs = (_lyapunov_tile(*task) for task in tasks)
+        for (rows, columns), output in zip(tiles, outputs):
+            result[:, rows, columns] = output
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            outputs = pool.map(_lyapunov_tile, *zip(*tasks))
+            for (rows, columns), output in zip(tiles, outputs):
+                result[:, rows, columns] = output
+    return result
+
+
+@dataclass
+class PoincareSection:
+    """
+    Crossings of the section theta1 = 0 with omega1 > 0 by an ensemble of trajectories.
+
+    Attributes:
+    points (np.ndarray): States at the crossings, shape (M, max_points, 4), nan past counts.
+    times (np.ndarray): Crossing times, shape (M, max_points), nan past counts.
+    counts (np.ndarray): Number of crossings recorded for each trajectory.
+    """
+    points: np.ndarray
+    times: np.ndarray
+    counts: np.ndarray
+
+    def trajectory(self, i: int) -> tuple:
+        """
+        (theta2, omega2) at the recorded crossings of trajectory i.
+        """
+        points = self.points[i, :self.counts[i]]
+        return points[:, 2], points[:, 3]
+
+
+def poincare_section(y0, t_end: float, h: float = 1e-2, max_points: int = 1000,
+                     L: float = 1.0, g: float = G) -> PoincareSection:
+    """
+    Record the Poincaré section theta1 = 0, omega1 > 0 of an ensemble.
+
+    theta1 is taken modulo 2π, so trajectories where the first rod flips
+    keep crossing the section. Crossings beyond max_points per trajectory
+    are dropped.
+
+    Parameters:
+    y0 (np.ndarray): Initial states [theta1, omega1, theta2, omega2], shape (4, M).
+    t_end (float): Duration in seconds.
+    h (float): RK4 step in seconds.
+    max_points (int): Crossings stored per trajectory.
+    L (float): Length of both rods in meters.
+    g (float): Acceleration due to gravity in m/s².
+
+    Returns:
+    PoincareSection: Crossing states and times.
+    """
+    y = np.array(y0, dtype=float)
+    M = y.shape[1]
+    points = np.full((M, max_points, 4), np.nan)
+    times = np.full((M, max_points), np.nan)
+    counts = np.zeros(M, dtype=int)
+
+    f0 = double_pendulum(0.0, y, L, g)
+    n_steps = int(round(t_end / h))
+    for step in range(n_steps):
+        t = step * h
+        y_old = y.copy()
+        rk4_step(double_pendulum, t, y, h, (L, g))
+        f1 = double_pendulum(t + h, y, L, g)
+
+        # Wrapped theta1 crosses 0 upwards, ruling out the jump at ±π.
+        before = np.remainder(y_old[0] + np.pi, 2 * np.pi) - np.pi
+        after = before + (y[0] - y_old[0])
+        crossed = np.flatnonzero((before < 0) & (after >= 0) & (counts < max_points))
+        if crossed.size:
+            s = _hermite_root(before[crossed], after[crossed], h * f0[0, crossed], h * f1[0, crossed])
+            state = _hermite(s, y_old[:, crossed], y[:, crossed], h * f0[:, crossed], h * f1[:, crossed])
+            slots = counts[crossed]
+            points[crossed, slots] = state.T
+            times[crossed, slots] = t + s * h
+            counts[crossed] += 1
+        f0 = f1
+    return PoincareSection(points, times, counts)
+
+
+def _poincare_tile(theta1, theta2, t_end, h, max_points, L, g):
+    section = poincare_section(grid_initial_conditions(theta1, theta2), t_end, h, max_points, L, g)
+    shape = (len(theta1), len(theta2))
+    return (section.points.reshape(shape + section.points.shape[1:]),
+            section.times.reshape(shape + section.times.shape[1:]), section.counts.reshape(shape))
+
+
+def _poincare_tile_into(directory: str, rows: slice, columns: slice, theta1, theta2, t_end, h, max_points,
+                        L, g) -> None:
+    for name, values in zip(POINCARE_FILES, _poincare_tile(theta1, theta2, t_end, h, max_points, L, g)):
+        array = open_memmap(os.path.join(directory, name), mode="r+")
+        array[rows, columns] = values
+        array.flush()
+
+
+def poincare_map(directory: str, theta1, theta2, t_end: float, h: float = 1e-2, max_points: int = 200,
+                 tile_shape: tuple = DEFAULT_TILE_SHAPE, workers: int | None = None,
+                 L: float = 1.0, g: float = G) -> PoincareSection:
+    """
+    Poincaré sections over the grid theta1 x theta2 of initial angles at rest, tiles in a process pool.
+
+    Like sweep, every worker writes its tile straight into .npy memory maps
+    in directory (POINCARE_FILES, overwritten), so the parent never holds
+    the grid in memory. The files take 40 * max_points + 8 bytes per grid
+    point, 8 GB for a 1000 x 1000 grid at max_points=200, and each worker
+    holds one tile of that in memory.
+
+    Returns:
+    PoincareSection: Read-only memory maps of the crossings of the len(theta1) * len(theta2)
+        trajectories in row-major order, trajectory i * len(theta2) + j starting from
+        (theta1[i], theta2[j]).
+    """
+    theta1 = np.asarray(theta1, dtype=float)
+    theta2 = np.asarray(theta2, dtype=float)
+    shape = (len(theta1), len(theta2))
+    tiles = tile_slices(shape, tile_shape)
+    # Every tile writes its whole block, so the files need no initial fill.
+    os.makedirs(directory, exist_ok=True)
+    paths = [os.path.join(directory, name) for name in POINCARE_FILES]
+    layouts = ((np.float64, (max_points, 4)), (np.float64, (max_points,)), (np.int64, ()))
+    for path, (dtype, trailing) in zip(paths, layouts):
+        open_memmap(path, mode="w+", dtype=dtype, shape=shape + trailing).flush()
+    tasks = [(directory, rows, columns, theta1[rows], theta2[columns], t_end, h, max_points, L, g)
+             for rows, columns in tiles]
+
+    workers = min(workers or os.cpu_count() or 1, len(tiles))
+    if workers == 1:
+        for task in tasks:
+            _poincare_tile_into(*task)
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            list(pool.map(_poincare_tile_into, *zip(*tasks)))
+    M = shape[0] * shape[1]
+    points, times, counts = (np.load(path, mmap_mode="r") for path in paths)
+    return PoincareSection(points.reshape(M, max_points, 4), times.reshape(M, max_points), counts.reshape(M))
+
+
+def _hermite(s, p0, p1, m0, m1):
+    """
+    Cubic Hermite interpolant at fraction s of a step, from the values and scaled slopes at both ends.
+    """
+    s2, s3 = s * s, s * s * s
+    return ((2 * s3 - 3 * s2 + 1) * p0 + (s3 - 2 * s2 + s) * m0
+            + (-2 * s3 + 3 * s2) * p1 + (s3 - s2) * m1)
+
+
+def _hermite_root(p0, p1, m0, m1, iterations: int = 4):
+    """
+    Fraction s in [0, 1] where the Hermite interpolant changes sign, by Newton from the secant guess.
+    """
+    s = np.clip(p0 / (p0 - p1), 0.0, 1.0)
+    for _ in range(iterations):
+        s2 = s * s
+        value = _hermite(s, p0, p1, m0, m1)
+        slope = ((6 * s2 - 6 * s) * p0 + (3 * s2 - 4 * s + 1) * m0
+                 + (-6 * s2 + 6 * s) * p1 + (3 * s2 - 2 * s) * m1)
+        s = np.clip(s - value / np.where(slope == 0, 1.0, slope), 0.0, 1.0)
+    return s
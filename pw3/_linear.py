@@ -0,0 +1,143 @@
+"""
+Exact solution of linear constant-coefficient ODEs without time stepping.
+
+For x' = A x + B u with a constant input u,
+
+    x(t) = exp(A t) x0 + t phi1(A t) B u,    phi1(z) = (exp(z) - 1) / z,
+
+so x can be evaluated at any set of times at once. LinearSystem factors A
+once, either by eigendecomposition (exp(A t) = V exp(Λ t) V^-1, which then
+costs O(n²) per time) or, when A is not safely diagonalizable, with the
+Padé matrix exponential of the augmented matrix [[A, B u], [0, 0]],
+evaluated for all the times in one stacked call. A leading batch axis on
+A and B solves many parameter sets together.
+"""
+import numpy as np
+from scipy.linalg import expm
+
+
+# Above this condition number of the eigenvectors, "auto" uses the matrix exponential.
+EIG_CONDITION_LIMIT = 1e8
+
+
+def _phi1(z: np.ndarray) -> np.ndarray:
+    """
+    (exp(z) - 1) / z, accurate for small |z| and 1 at z = 0.
+    """
+    small = np.abs(z) < 1e-8
+    safe = np.where(small, 1.0, z)
+    return np.where(small, 1 + z / 2, np.expm1(safe) / safe)
+
+
+class LinearSystem:
+
+    def __init__(self, A, B=None, method: str = "auto") -> None:
+        """
+        The linear system x' = A x + B u, factored for repeated evaluation.
+
+        Parameters:
+        A (np.ndarray): State matrix, shape (n, n) or (sets, n, n) for several parameter sets.
+        B (np.ndarray | None): Input matrix, shape (n, m) or (sets, n, m); no input if None.
+        method (str): "eig", "expm" or "auto" (eig unless the eigenvectors are ill-conditioned).
+        """
+        if method not in ("auto", "eig", "expm"):
+            raise ValueError(f"Unknown method {method!r}, expected one of ['auto', 'eig', 'expm']")
+        self.A = np.asarray(A, dtype=float)
+        n = self.A.shape[-1]
+        self.B = np.zeros(self.A.shape[:-1] + (1,)) if B is None else np.asarray(B, dtype=float)
+        self.n = n
+
+        if method in ("auto", "eig"):
+            eigenvalues, V = np.linalg.eig(self.A)
+            condition = np.linalg.cond(V)
+            if method == "eig" or np.all(condition < EIG_CONDITION_LIMIT):
+                self.method = "eig"
+                self.eigenvalues = eigenvalues
+                self.V = V
+                self.V_inv = np.linalg.inv(V)
+                return
+        self.method = "expm"
+
+    def _forcing(self, u) -> np.ndarray:
+        if u is None:
+            return np.zeros(self.A.shape[:-1])
+        u = np.asarray(u, dtype=float)
+        return np.einsum("...ij,...j->...i", self.B, np.broadcast_to(u, self.B.shape[:-2] + u.shape[-1:]))
+
+    def evaluate(self, t, x0, u=None) -> np.ndarray:
+        """
+        State at every time of t, from x(0) = x0 and a constant input u.
+
+        Parameters:
+        t (np.ndarray): Times, any order, shape (times,).
+        x0 (np.ndarray): Initial state, shape (n,) or (sets, n).
+        u (np.ndarray | None): Constant input, shape (m,) or (sets, m); zero if None.
+
+        Returns:
+        np.ndarray: States of shape (n, times), or (sets, n, times) for batched systems.
+        """
+        t = np.asarray(t, dtype=float)
+        x0 = np.asarray(x0, dtype=float)
+        b = self._forcing(u)
+        if self.method == "eig":
+            lt = self.eigenvalues[..., :, None] * t
+            c = np.einsum("...ij,...j->...i", self.V_inv, x0 + 0j)
+            d = np.einsum("...ij,...j->...i", self.V_inv, b + 0j)
+            modes = c[..., None] * np.exp(lt) + d[..., None] * t * _phi1(lt)
+            x = np.einsum("...ij,...jt->...it", self.V, modes)
+            return x.real if np.isrealobj(self.A) else x
+
+        n = self.n
+        batch = np.broadcast_shapes(self.A.shape[:-2], x0.shape[:-1], b.shape[:-1])
+        M = np.zeros(batch + (n + 1, n + 1))
+        M[..., :n, :n] = self.A
+        M[..., :n, n] = b
+        # One stacked Padé exponential for all times: shape batch + (times, n + 1, n + 1)
+        E = expm(M[..., None, :, :] * t[:, None, None])
+        z0 = np.concatenate([np.broadcast_to(x0, batch + (n,)), np.ones(batch + (1,))], axis=-1)
+        x = np.einsum("...tij,...j->...it", E[..., :n, :], z0)
+        return x
+
+    def __call__(self, t, x0, u=None) -> np.ndarray:
+        return self.evaluate(t, x0, u)
+
+
+def rc_circuit(R, C) -> LinearSystem:
+    """
+    Capacitor voltage of a series RC circuit, V_C' = (Vin - V_C) / (R C), with input u = [Vin].
+
+    R and C may be arrays, giving one parameter set per element.
+    """
+    tau = np.asarray(R, dtype=float) * np.asarray(C, dtype=float)
+    return LinearSystem((-1 / tau)[..., None, None], (1 / tau)[..., None, None])
+
+
+def rc_ladder(R, C, stages: int) -> LinearSystem:
+    """
+    Node voltages of an RC ladder of identical stages driven by u = [Vin].
+
+    Stage k is a series resistor R from node k - 1 (the source for k = 1)
+    to node k and a capacitor C from node k to ground.
+    """
+    rate = 1 / (np.asarray(R, dtype=float) * np.asarray(C, dtype=float))[..., None, None]
+    laplacian = 2 * np.eye(stages) - np.eye(stages, k=1) - np.eye(stages, k=-1)
+    laplacian[-1, -1] = 1
+    B = np.zeros((stages, 1))
+    B[0, 0] = 1
+    return LinearSystem(-rate * laplacian, rate * B)
+
+
+def rlc_series(R, L, C) -> LinearSystem:
+    """
+    Series RLC circuit with state [V_C, I] driven by u = [Vin].
+
+    V_C' = I / C and L I' = Vin - V_C - R I. R, L and C may be arrays.
+    """
+    R, L, C = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (R, L, C)))
+    A = np.zeros(R.shape + (2, 2))
+    A[..., 0, 1] = 1 / C
+    A[..., 1, 0] = -1 / L
+    A[..., 1, 1] = -R / L
+    B = np.zeros(R.shape + (2, 1))
+    B[..., 1, 0] = 1 / L
+    return LinearSystem(A, B)
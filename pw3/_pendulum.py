@@ -0,0 +1,368 @@
+"""
+Batched pendulum models and ensemble integrators.
+
+Every right-hand side takes a state of shape (4, ...) for the double
+pendulum or (2, ...) for the simple one, the first axis holding the state
+variables and the trailing axes any number of trajectories. The same
+function therefore serves one trajectory, an ensemble of shape (4, M), and
+solve_ivp(..., vectorized=True).
+
+rk4 and dopri5 advance a whole ensemble together: each step is a handful
+of array operations over all trajectories, so 10^5 initial conditions cost
+about as many Python-level operations as one.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+from scipy.integrate import solve_ivp
+
+
+G = 9.81  # Acceleration due to gravity (m/s^2)
+
+
+def simple_pendulum(t, y, L: float = 0.2, g: float = G) -> np.ndarray:
+    """
+    Right-hand side of the simple pendulum for a state [theta, omega] of shape (2, ...).
+    """
+    dydt = np.empty_like(y, dtype=float)
+    dydt[0] = y[1]
+    dydt[1] = -g / L * np.sin(y[0])
+    return dydt
+
+
+def double_pendulum(t, y, L: float = 1.0, g: float = G) -> np.ndarray:
+    """
+    Right-hand side of the double pendulum with equal masses and equal lengths.
+
+    Parameters:
+    t (float): Time, unused (the system is autonomous).
+    y (np.ndarray): State [theta1, omega1, theta2, omega2] of shape (4, ...).
+    L (float): Length of both rods in meters.
+    g (float): Acceleration due to gravity in m/s².
+
+    Returns:
+    np.ndarray: Time derivative of the state, with the shape of y.
+    """
+    theta1, omega1, theta2, omega2 = y
+    delta = theta1 - theta2
+    sin_delta, cos_delta = np.sin(delta), np.cos(delta)
+    w1, w2 = omega1 ** 2, omega2 ** 2
+    # Equal masses make the mass matrix determinant 3 - cos(2 delta) >= 2, never singular.
+    den = L * (3 - np.cos(2 * delta))
+
+    dydt = np.empty_like(y, dtype=float)
+    dydt[0] = omega1
+    dydt[1] = (-3 * g * np.sin(theta1) - g * np.sin(theta1 - 2 * theta2)
+               - 2 * sin_delta * L * (w2 + w1 * cos_delta)) / den
+    dydt[2] = omega2
+    dydt[3] = 2 * sin_delta * (2 * L * w1 + 2 * g * np.cos(theta1) + L * w2 * cos_delta) / den
+    return dydt
+
+
+def simple_pendulum_jacobian(t, y, L: float = 0.2, g: float = G) -> np.ndarray:
+    """
+    Jacobian of simple_pendulum with respect to the state, shape (2, 2, ...).
+    """
+    y = np.asarray(y, dtype=float)
+    J = np.zeros((2, 2) + y.shape[1:])
+    J[0, 1] = 1.0
+    J[1, 0] = -g / L * np.cos(y[0])
+    return J
+
+
+def double_pendulum_jacobian(t, y, L: float = 1.0, g: float = G) -> np.ndarray:
+    """
+    Jacobian of double_pendulum with respect to the state, shape (4, 4, ...).
+
+    Each acceleration is N / D with D = L (3 - cos(2 delta)), so its
+    derivative is (N' - (N / D) D') / D.
+    """
+    theta1, omega1, theta2, omega2 = np.asarray(y, dtype=float)
+    delta = theta1 - theta2
+    s, c = np.sin(delta), np.cos(delta)
+    w1, w2 = omega1 ** 2, omega2 ** 2
+    den = L * (3 - np.cos(2 * delta))
+    dden = 2 * L * np.sin(2 * delta)  # derivative of D by theta1, minus that by theta2
+    f1 = (-3 * g * np.sin(theta1) - g * np.sin(theta1 - 2 * theta2) - 2 * s * L * (w2 + w1 * c)) / den
+    inner = 2 * L * w1 + 2 * g * np.cos(theta1) + L * w2 * c
+    f2 = 2 * s * inner / den
+    coupling = 2 * L * (c * w2 + w1 * np.cos(2 * delta))
+    cos_12 = g * np.cos(theta1 - 2 * theta2)
+
+    J = np.zeros((4, 4) + np.shape(theta1))
+    J[0, 1] = 1.0
+    J[2, 3] = 1.0
+    J[1, 0] = (-3 * g * np.cos(theta1) - cos_12 - coupling - f1 * dden) / den
+    J[1, 1] = -4 * L * s * c * omega1 / den
+    J[1, 2] = (2 * cos_12 + coupling + f1 * dden) / den
+    J[1, 3] = -4 * L * s * omega2 / den
+    J[3, 0] = (2 * c * inner - 2 * s * (2 * g * np.sin(theta1) + L * w2 * s) - f2 * dden) / den
+    J[3, 1] = 8 * L * s * omega1 / den
+    J[3, 2] = (-2 * c * inner + 2 * L * w2 * s ** 2 + f2 * dden) / den
+    J[3, 3] = 4 * L * s * c * omega2 / den
+    return J
+
+
+def double_pendulum_energy(y, L: float = 1.0, g: float = G) -> np.ndarray:
+    """
+    Total energy per unit mass of double pendulum states of shape (4, ...), in J/kg.
+    """
+    theta1, omega1, theta2, omega2 = y
+    kinetic = L ** 2 * (omega1 ** 2 + omega2 ** 2 / 2 + omega1 * omega2 * np.cos(theta1 - theta2))
+    potential = -g * L * (2 * np.cos(theta1) + np.cos(theta2))
+    return kinetic + potential
+
+
+def second_mass_position(y, L: float = 1.0) -> tuple:
+    """
+    Cartesian position (x2, y2) of the second mass for states of shape (4, ...).
+    """
+    return L * (np.sin(y[0]) + np.sin(y[2])), -L * (np.cos(y[0]) + np.cos(y[2]))
+
+
+def grid_initial_conditions(theta1, theta2) -> np.ndarray:
+    """
+    States at rest for every pair of the given angles (in radians), shape (4, len(theta1) * len(theta2)).
+
+    The trajectories are ordered with theta2 varying fastest, so the result
+    of an ensemble reshapes to (..., len(theta1), len(theta2)).
+    """
+    theta1, theta2 = np.meshgrid(theta1, theta2, indexing="ij")
+    y0 = np.zeros((4, theta1.size))
+    y0[0] = theta1.ravel()
+    y0[2] = theta2.ravel()
+    return y0
+
+
+@dataclass
+class EnsembleSolution:
+    """
+    Ensemble of trajectories sampled at common times.
+
+    Attributes:
+    t (np.ndarray): Sample times, shape (times,).
+    y (np.ndarray): States, shape (states, trajectories..., times).
+    nfev (int): Number of right-hand side evaluations, each over the whole ensemble.
+    steps (int): Number of accepted steps, 0 when the integrator does not report it.
+    rejected (int): Number of rejected steps, 0 for fixed-step methods.
+    """
+    t: np.ndarray
+    y: np.ndarray
+    nfev: int
+    steps: int
+    rejected: int = 0
+
+
+def _targets(t_span, t_eval) -> np.ndarray:
+    t0, t1 = t_span
+    targets = np.array([t1], dtype=float) if t_eval is None else np.asarray(t_eval, dtype=float)
+    if targets.ndim != 1 or np.any(np.diff(targets) <= 0) or targets[0] < t0 or targets[-1] > t1:
+        raise ValueError("t_eval must be increasing and inside t_span")
+    return targets
+
+
+def rk4_step(fun, t: float, y: np.ndarray, h: float, args=()) -> np.ndarray:
+    """
+    Advance the states y by one classical Runge–Kutta step of size h, in place.
+    """
+    k1 = fun(t, y, *args)
+    k2 = fun(t + h / 2, y + h / 2 * k1, *args)
+    k3 = fun(t + h / 2, y + h / 2 * k2, *args)
+    k4 = fun(t + h, y + h * k3, *args)
+    k2 += k3
+    k2 *= 2
+    k2 += k1
+    k2 += k4
+    y += h / 6 * k2
+    return y
+
+
+def rk4(fun, t_span, y0, h: float, t_eval=None, args=()) -> EnsembleSolution:
+    """
+    Classical fixed-step Runge–Kutta integration of a whole ensemble.
+
+    The step between two consecutive output times is the largest one not
+    exceeding h that divides the interval evenly, so every output lands
+    exactly on a step.
+
+    Parameters:
+    fun (callable): Batched right-hand side fun(t, y, *args).
+    t_span (tuple[float, float]): Start and end time.
+    y0 (np.ndarray): Initial states, shape (states, trajectories...).
+    h (float): Maximum step.
+    t_eval (np.ndarray | None): Output times, only the final state if None.
+    args (tuple): Extra arguments of fun.
+
+    Returns:
+    EnsembleSolution: States at the output times.
+    """
+    targets = _targets(t_span, t_eval)
+    y = np.array(y0, dtype=float)
+    out = np.empty(y.shape + targets.shape)
+    t = float(t_span[0])
+    steps = 0
+    for i, target in enumerate(targets):
+        n = int(np.ceil((target - t) / h - 1e-9)) if target > t else 0
+        step = (target - t) / n if n else 0.0
+        for _ in range(n):
+            rk4_step(fun, t, y, step, args)
+            t += step
+        t = float(target)
+        steps += n
+        out[..., i] = y
+    return EnsembleSolution(targets, out, 4 * steps, steps)
+
+
+# Dormand–Prince 5(4) tableau
+_C = np.array([0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1, 1])
+_A = [
+    [],
+    [1 / 5],
+    [3 / 40, 9 / 40],
+    [44 / 45, -56 / 15, 32 / 9],
+    [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729],
+    [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+    [35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84],
+]
+# Difference between the fifth- and fourth-order weights
+_E = np.array([71 / 57600, 0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40])
+
+
+def _error_norm(error: np.ndarray, scale: np.ndarray) -> float:
+    # RMS over the state variables, worst trajectory of the ensemble
+    ratio = error / scale
+    return float(np.sqrt(np.mean(ratio ** 2, axis=0)).max(initial=0.0))
+
+
+def dopri5(fun, t_span, y0, rtol: float = 1e-6, atol: float = 1e-9, t_eval=None, args=(),
+           h0: float | None = None, max_steps: int = 1_000_000) -> EnsembleSolution:
+    """
+    Adaptive Dormand–Prince 5(4) integration of a whole ensemble with a shared step.
+
+    The step is controlled by the worst trajectory of the ensemble, so
+    every trajectory is at least as accurate as with its own step; splitting
+    a large ensemble into tiles keeps one chaotic trajectory from slowing
+    down the others. Steps are shortened to land exactly on the output times.
+
+    Parameters:
+    fun (callable): Batched right-hand side fun(t, y, *args).
+    t_span (tuple[float, float]): Start and end time.
+    y0 (np.ndarray): Initial states, shape (states, trajectories...).
+    rtol, atol (float): Relative and absolute tolerances, as in solve_ivp.
+    t_eval (np.ndarray | None): Output times, only the final state if None.
+    args (tuple): Extra arguments of fun.
+    h0 (float | None): First step, estimated from the initial derivative if None.
+    max_steps (int): Maximum number of attempted steps.
+
+    Returns:
+    EnsembleSolution: States at the output times.
+    """
+    targets = _targets(t_span, t_eval)
+    y = np.array(y0, dtype=float)
+    out = np.empty(y.shape + targets.shape)
+    t = float(t_span[0])
+    k = [None] * 7
+    k[0] = fun(t, y, *args)
+    nfev = 1
+    if h0 is None:
+        scale = atol + rtol * np.abs(y)
+        d0, d1 = _error_norm(y, scale), _error_norm(k[0], scale)
+        h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+    h = min(h0, t_span[1] - t) if t_span[1] > t else h0
+    steps = rejected = 0
+
+    for i, target in enumerate(targets):
+        while t < target:
+            if steps + rejected >= max_steps:
+                raise RuntimeError(f"dopri5 did not reach t={target} in {max_steps} steps")
+            step = min(h, target - t)
+            for s in range(1, 7):
+                stage = y.copy()
+                for a, ks in zip(_A[s], k):
+                    if a:
+                        stage += step * a * ks
+                k[s] = fun(t + _C[s] * step, stage, *args)
+            nfev += 6
+            # The last stage is evaluated at the fifth-order solution.
+            y_new = stage
+            error = step * sum(e * ks for e, ks in zip(_E, k) if e)
+            scale = atol + rtol * np.maximum(np.abs(y), np.abs(y_new))
+            norm = _error_norm(error, scale)
+            factor = 10.0 if norm == 0 else min(10.0, max(0.2, 0.9 * norm ** -0.2))
+            if norm <= 1:
+                t = target if step == target - t else t + step
+                y = y_new
+                k[0] = k[6]
+                steps += 1
+                if step == h:
+                    h *= factor
+            else:
+                if step < 1e-14 * max(1.0, abs(t)):
+                    raise RuntimeError(f"dopri5 step size underflow at t={t}")
+                h = step * min(1.0, factor)
+                rejected += 1
+        out[..., i] = y
+    return EnsembleSolution(targets, out, nfev, steps, rejected)
+
+
+def solve_ivp_ensemble(fun, t_span, y0, t_eval=None, args=(), **options) -> EnsembleSolution:
+    """
+    Integrate a whole ensemble with one solve_ivp call, passing vectorized=True.
+
+    solve_ivp sees the ensemble as one flat system; the batched right-hand
+    side is applied to all trajectories (and to all the columns solve_ivp
+    asks for at once) in a single call.
+
+    Parameters:
+    fun (callable): Batched right-hand side fun(t, y, *args).
+    t_span (tuple[float, float]): Start and end time.
+    y0 (np.ndarray): Initial states, shape (states, trajectories...).
+    t_eval (np.ndarray | None): Output times, only the final state if None.
+    args (tuple): Extra arguments of fun.
+    **options: Passed to solve_ivp (method, rtol, atol, ...).
+
+    Returns:
+    EnsembleSolution: States at the output times.
+    """
+    targets = _targets(t_span, t_eval)
+    y0 = np.asarray(y0, dtype=float)
+    shape = y0.shape
+
+    def flat(t, y):
+        # (states * M,) or (states * M, k) viewed as states x (M * k) trajectories
+        return fun(t, y.reshape(shape[0], -1), *args).reshape(y.shape)
+
+    solution = solve_ivp(flat, t_span, y0.ravel(), t_eval=targets, vectorized=True, **options)
+    if not solution.success:
+        raise RuntimeError(solution.message)
+    return EnsembleSolution(solution.t, solution.y.reshape(shape + (-1,)), solution.nfev, 0)
+
+
+INTEGRATORS = {
+    "rk4": rk4,
+    "rk45": dopri5,
+    "solve_ivp": solve_ivp_ensemble,
+}
+
+
+def integrate_ensemble(fun, t_span, y0, integrator: str = "rk45", t_eval=None, args=(),
+                       **options) -> EnsembleSolution:
+    """
+    Integrate an ensemble of initial conditions with one of the INTEGRATORS.
+
+    Parameters:
+    fun (callable): Batched right-hand side fun(t, y, *args), e.g. double_pendulum.
+    t_span (tuple[float, float]): Start and end time.
+    y0 (np.ndarray): Initial states, shape (states, trajectories...).
+    integrator (str): "rk4" (needs h=...), "rk45" or "solve_ivp".
+    t_eval (np.ndarray | None): Output times, only the final state if None.
+    args (tuple): Extra arguments of fun.
+    **options: Extra parameters of the integrator (h, rtol, atol, ...), including
+        the method of solve_ivp.
+
+    Returns:
+    EnsembleSolution: States at the output times.
+    """
+    if integrator not in INTEGRATORS:
+        raise ValueError(f"Unknown integrator {integrator!r}, expected one of {sorted(INTEGRATORS)}")
+    return INTEGRATORS[integrator](fun, t_span, y0, t_eval=t_eval, args=args, **options)
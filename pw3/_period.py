@@ -0,0 +1,119 @@
+"""
+Period of the simple pendulum as a function of the amplitude.
+
+Released from rest at theta0, the pendulum swings with period
+
+    T = 4 sqrt(L / g) K(sin²(theta0 / 2)),
+
+K being the complete elliptic integral of the first kind, which
+scipy.special.ellipk evaluates for a whole array of amplitudes in
+microseconds. Results are memoized per (amplitudes, L, g), and
+period_from_events measures the same periods by integrating the equation
+of motion, to cross-check a sample of them.
+"""
+from functools import lru_cache
+
+import numpy as np
+from scipy.integrate import solve_ivp
+from scipy.special import ellipk
+
+from ._pendulum import G, simple_pendulum
+
+
+# Below this amplitude in radians the elliptic correction (about theta0² / 16
+# relative) is under 1e-13 and the crossings are lost in the integration
+# tolerance, so the small-angle period is returned instead.
+MIN_EVENT_AMPLITUDE = 1e-6
+
+
+def small_angle_period(L: float = 0.2, g: float = G) -> float:
+    """
+    Period 2π sqrt(L / g) of the linearized pendulum.
+    """
+    return 2 * np.pi * np.sqrt(L / g)
+
+
+@lru_cache(maxsize=64)
+def _periods(amplitudes: bytes, L: float, g: float) -> np.ndarray:
+    theta0 = np.abs(np.frombuffer(amplitudes))
+    period = 4 * np.sqrt(L / g) * ellipk(np.sin(theta0 / 2) ** 2)
+    # At and beyond π the pendulum never swings back.
+    period[theta0 >= np.pi] = np.inf
+    period.flags.writeable = False
+    return period
+
+
+def pendulum_period(theta0, L: float = 0.2, g: float = G) -> np.ndarray:
+    """
+    Exact period of the simple pendulum released from rest, for any number of amplitudes.
+
+    Parameters:
+    theta0 (float | np.ndarray): Amplitudes in radians.
+    L (float): Length of the pendulum in meters.
+    g (float): Acceleration due to gravity in m/s².
+
+    Returns:
+    np.ndarray: Periods in seconds with the shape of theta0 (read-only, shared with the cache),
+        inf for amplitudes of π or more.
+    """
+    theta0 = np.asarray(theta0, dtype=float)
+    return _periods(theta0.tobytes(), float(L), float(g)).reshape(theta0.shape)
+
+
+def _crossing(t, y, L, g):
+    return y[0]
+
+
+_crossing.direction = -1
+
+
+def period_from_events(theta0, L: float = 0.2, g: float = G, rtol: float = 1e-10,
+                       atol: float = 1e-12) -> np.ndarray:
+    """
+    Periods measured by integrating the pendulum and locating its zero crossings.
+
+    Released from rest at |theta0|, the pendulum crosses theta = 0 downwards
+    once per period; solve_ivp locates the first two of these crossings by
+    root finding on its dense output, so the result is accurate to the
+    integration tolerance. Amplitudes below MIN_EVENT_AMPLITUDE, where the
+    crossings would be roundoff, get the small-angle period.
+
+    Parameters:
+    theta0 (float | np.ndarray): Amplitudes in radians, below π.
+    L (float): Length of the pendulum in meters.
+    g (float): Acceleration due to gravity in m/s².
+    rtol, atol (float): Tolerances of solve_ivp.
+
+    Returns:
+    np.ndarray: Periods in seconds with the shape of theta0.
+    """
+    amplitudes = np.abs(np.asarray(theta0, dtype=float))
+    estimate = pendulum_period(amplitudes, L, g)
+    periods = np.empty(amplitudes.shape)
+    for i in np.ndindex(amplitudes.shape):
+        if not estimate[i] < np.inf:
+            raise ValueError(f"no period for an amplitude of {amplitudes[i]} rad")
+        if amplitudes[i] < MIN_EVENT_AMPLITUDE:
+            periods[i] = small_angle_period(L, g)
+            continue
+        solution = solve_ivp(simple_pendulum, (0, 2 * estimate[i]), [amplitudes[i], 0.0], args=(L, g),
+                             method="DOP853", events=_crossing, rtol=rtol, atol=atol)
+        crossings = solution.t_events[0]
+        periods[i] = crossings[1] - crossings[0]
+    return periods
+
+
+def period_cross_check(theta0, samples: int = 10, L: float = 0.2, g: float = G, seed=None) -> float:
+    """
+    Largest relative difference between the elliptic and the event-based periods
+    over a random sample of the amplitudes.
+
+    Amplitudes of π or more, which have no period, and below
+    MIN_EVENT_AMPLITUDE, which have no measurable crossings, are skipped.
+    """
+    theta0 = np.ravel(np.asarray(theta0, dtype=float))
+    theta0 = theta0[(np.abs(theta0) < np.pi) & (np.abs(theta0) >= MIN_EVENT_AMPLITUDE)]
+    rng = np.random.default_rng(seed)
+    sample = rng.choice(theta0, size=min(samples, theta0.size), replace=False)
+    exact = pendulum_period(sample, L, g)
+    return float(np.max(np.abs(period_from_events(sample, L, g) - exact) / exact, initial=0.0))
@@ -0,0 +1,156 @@
+"""
+Resumable parallel sweep of the double pendulum over a (theta1, theta2) grid.
+
+The grid is split into tiles that run as batched RK4 ensembles in a
+process pool. Each worker writes its tile straight into a .npy memory map,
+and the parent marks the tile done in a second memory map once the worker
+has flushed it. An interrupted sweep picks up from the tiles not marked
+done when it is started again on the same directory.
+
+Files of a sweep directory:
+
+* sweep.json: parameters of the sweep, checked when resuming.
+* results.npy: float64 array (len(theta1), len(theta2), len(FIELDS)).
+* done.npy: bool array with one flag per tile.
+"""
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+from numpy.lib.format import open_memmap
+
+from ._pendulum import G, double_pendulum, double_pendulum_energy, grid_initial_conditions, rk4_step
+
+
+FIELDS = ("theta1", "omega1", "theta2", "omega2", "flip_time", "energy_error")
+
+DEFAULT_TILE_SHAPE = (64, 64)
+
+
+def tile_slices(shape: tuple, tile_shape: tuple) -> list:
+    """
+    Tiles covering a 2-D grid, as (rows, columns) slices in row-major order.
+    """
+    return [(slice(i, min(i + tile_shape[0], shape[0])), slice(j, min(j + tile_shape[1], shape[1])))
+            for i in range(0, shape[0], tile_shape[0])
+            for j in range(0, shape[1], tile_shape[1])]
+
+
+def run_tile(theta1, theta2, t_end: float, h: float, L: float = 1.0, g: float = G) -> np.ndarray:
+    """
+    Integrate every pair of initial angles from rest and summarize each trajectory.
+
+    The flip time is the first step at which either rod goes over the top
+    (|theta| > π), nan if neither does before t_end. The energy error is
+    the change of the energy per unit mass between t = 0 and t_end.
+
+    Parameters:
+    theta1, theta2 (np.ndarray): Initial angles in radians.
+    t_end (float): Duration of each trajectory in seconds.
+    h (float): RK4 step in seconds.
+    L (float): Length of both rods in meters.
+    g (float): Acceleration due to gravity in m/s².
+
+    Returns:
+    np.ndarray: Array (len(theta1), len(theta2), len(FIELDS)).
+    """
+    y = grid_initial_conditions(theta1, theta2)
+    energy0 = double_pendulum_energy(y, L, g)
+    flip_time = np.full(y.shape[1], np.nan)
+    n_steps = int(np.ceil(t_end / h - 1e-9))
+    step = t_end / n_steps
+    for i in range(n_steps):
+        rk4_step(double_pendulum, i * step, y, step, (L, g))
+        flipped = (np.abs(y[0]) > np.pi) | (np.abs(y[2]) > np.pi)
+        flipped &= np.isnan(flip_time)
+        flip_time[flipped] = (i + 1) * step
+
+    result = np.empty((len(FIELDS), y.shape[1]))
+    result[:4] = y
+    result[4] = flip_time
+    result[5] = double_pendulum_energy(y, L, g) - energy0
+    return result.T.reshape(len(theta1), len(theta2), len(FIELDS))
+
+
+def _run_tile_into(path: str, rows: slice, columns: slice, theta1, theta2, t_end, h, L, g) -> None:
+    results = open_memmap(path, mode="r+")
+    results[rows, columns] = run_tile(theta1, theta2, t_end, h, L, g)
+    results.flush()
+
+
+def _open_sweep(directory: str, parameters: dict, shape: tuple, n_tiles: int) -> tuple:
+    config = os.path.join(directory, "sweep.json")
+    results_path = os.path.join(directory, "results.npy")
+    done_path = os.path.join(directory, "done.npy")
+    if os.path.exists(config):
+        with open(config) as file:
+            if json.load(file) != parameters:
+                raise ValueError(f"{directory!r} holds a sweep with different parameters")
+        return open_memmap(done_path, mode="r+"), results_path
+
+    os.makedirs(directory, exist_ok=True)
+    results = open_memmap(results_path, mode="w+", dtype=np.float64, shape=shape + (len(FIELDS),))
+    results[:] = np.nan
+    results.flush()
+    done = open_memmap(done_path, mode="w+", dtype=bool, shape=(n_tiles,))
+    done.flush()
+    # Written last: a directory without sweep.json is started from scratch.
+    with open(config, "w") as file:
+        json.dump(parameters, file, indent=2)
+    return done, results_path
+
+
+def sweep(directory: str, theta1, theta2, t_end: float = 10.0, h: float = 1e-2,
+          tile_shape: tuple = DEFAULT_TILE_SHAPE, workers: int | None = None,
+          L: float = 1.0, g: float = G) -> np.memmap:
+    """
+    Run (or resume) a double pendulum sweep over the grid theta1 x theta2.
+
+    Parameters:
+    directory (str): Where the sweep is stored; an existing sweep with the same parameters is resumed.
+    theta1, theta2 (np.ndarray): Initial angles of the grid in radians.
+    t_end (float): Duration of each trajectory in seconds.
+    h (float): RK4 step in seconds.
+    tile_shape (tuple[int, int]): Grid points per tile.
+    workers (int | None): Number of processes, defaults to os.cpu_count(); 1 runs in this process.
+    L (float): Length of both rods in meters.
+    g (float): Acceleration due to gravity in m/s².
+
+    Returns:
+    np.memmap: Read-only results (len(theta1), len(theta2), len(FIELDS)).
+    """
+    theta1 = np.asarray(theta1, dtype=float)
+    theta2 = np.asarray(theta2, dtype=float)
+    shape = (len(theta1), len(theta2))
+    tiles = tile_slices(shape, tile_shape)
+    parameters = {"theta1": theta1.tolist(), "theta2": theta2.tolist(), "t_end": float(t_end),
+                  "h": float(h), "tile_shape": list(tile_shape), "L": float(L), "g": float(g)}
+    done, results_path = _open_sweep(directory, parameters, shape, len(tiles))
+    pending = [i for i in range(len(tiles)) if not done[i]]
+
+    def task(i: int) -> tuple:
+        rows, columns = tiles[i]
+        return results_path, rows, columns, theta1[rows], theta2[columns], t_end, h, L, g
+
+    workers = min(workers or os.cpu_count() or 1, max(1, len(pending)))
+    if workers == 1:
+        for i in pending:
+            _run_tile_into(*task(i))
+            done[i] = True
+            done.flush()
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            futures = {pool.submit(_run_tile_into, *task(i)): i for i in pending}
+            for future in as_completed(futures):
+                future.result()
+                done[futures[future]] = True
+                done.flush()
+    return load_sweep(directory)
+
+
+def load_sweep(directory: str) -> np.memmap:
+    """
+    Open the results of a sweep read-only; tiles not run yet hold nan.
+    """
+    return np.load(os.path.join(directory, "results.npy"), mmap_mode="r")
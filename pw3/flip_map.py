@@ -0,0 +1,24 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from pw3 import sweep
+
+# Grid of initial angles, both rods at rest
+n = 200
+theta1 = np.linspace(-np.pi, np.pi, n)
+theta2 = np.linspace(-np.pi, np.pi, n)
+
+# Run the sweep in tiles on all cores; running the script again resumes an interrupted sweep
+results = sweep('./pw3/data/flip_sweep', theta1, theta2, t_end=10.0, h=1e-2)
+flip_time = results[..., 4]
+print(f"Largest energy error: {np.nanmax(np.abs(results[..., 5])):.3e} J/kg")
+
+# Time until either rod flips over, white where neither flips within 10 s
+plt.figure(figsize=(8, 7))
+plt.imshow(np.log10(flip_time).T, origin='lower', cmap='viridis',
+           extent=np.degrees([theta1[0], theta1[-1], theta2[0], theta2[-1]]))
+plt.colorbar(label='log10(flip time / s)')
+plt.title('Double Pendulum - Time to First Flip')
+plt.xlabel('θ1 (degrees)')
+plt.ylabel('θ2 (degrees)')
+plt.tight_layout()
+plt.savefig('./pw3/data/4_flip_map.png')
@@ -0,0 +1,7 @@
+from ._mna import MNASolution
+from ._mna import Netlist
+from ._mna import assemble_mna
+from ._mna import grid_netlist
+from ._mna import parse_netlist
+from ._mna import read_netlist
+from ._mna import solve_mna
@@ -0,0 +1,227 @@
+"""
+Sparse modified nodal analysis (MNA) of resistor networks.
+
+A netlist of resistors, independent voltage sources and independent
+current sources is assembled into the MNA system
+
+    [G  B] [v]   [i]
+    [Bᵀ 0] [j] = [e]
+
+with v the node voltages, j the currents through the voltage sources, G
+the conductance matrix, i the injected currents and e the source voltages.
+The matrix is built as a scipy.sparse COO matrix straight from the element
+arrays and factored with a sparse LU, so memory and time grow with the
+number of elements rather than with the square of the number of nodes.
+
+Netlist syntax, one element per line, SPICE style (the element letter is
+case-insensitive, node 0 or gnd is ground, '*' starts a comment line):
+
+    R<name> <node1> <node2> <ohms>
+    V<name> <node+> <node-> <volts>
+    I<name> <node+> <node-> <amperes>   (flows from node+ through the source to node-)
+
+Values take the usual suffixes: f p n u m k meg g t.
+"""
+import re
+from dataclasses import dataclass, field
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import splu
+
+
+GROUND_NAMES = ("0", "gnd")
+
+SUFFIXES = {"f": 1e-15, "p": 1e-12, "n": 1e-9, "u": 1e-6, "m": 1e-3,
+            "k": 1e3, "meg": 1e6, "g": 1e9, "t": 1e12}
+
+_VALUE = re.compile(r"^([-+]?(?:\d+\.?\d*|\.\d+)(?:e[-+]?\d+)?)(meg|[fpnumkgt])?[a-z]*$")
+
+
+def parse_value(text: str) -> float:
+    """
+    Parse a SPICE value such as '10k', '4.7u' or '1e3' into a float.
+    """
+    match = _VALUE.match(text.lower())
+    if match is None:
+        raise ValueError(f"Invalid value {text!r}")
+    number, suffix = match.groups()
+    return float(number) * SUFFIXES.get(suffix, 1.0)
+
+
+@dataclass
+class Netlist:
+    """
+    Elements of a circuit as arrays of node indices; index -1 is ground.
+
+    Attributes:
+    nodes (list[str]): Names of the non-ground nodes, in index order.
+    resistors (tuple[np.ndarray, np.ndarray, np.ndarray]): Nodes and resistance of every resistor.
+    voltage_sources (tuple[np.ndarray, np.ndarray, np.ndarray]): Nodes (+, -) and voltage of every source.
+    current_sources (tuple[np.ndarray, np.ndarray, np.ndarray]): Nodes (+, -) and current of every source.
+    voltage_source_names (list[str]): Names of the voltage sources, in order.
+    """
+    nodes: list
+    resistors: tuple
+    voltage_sources: tuple
+    current_sources: tuple
+    voltage_source_names: list = field(default_factory=list)
+
+    def node_index(self, name: str) -> int:
+        """
+        Index of a node in the solution vector, -1 for ground.
+        """
+        if name.lower() in GROUND_NAMES:
+            return -1
+        return self.nodes.index(name)
+
+
+def _elements(triples: list) -> tuple:
+    if not triples:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0)
+    first, second, values = zip(*triples)
+    return np.array(first, dtype=np.int64), np.array(second, dtype=np.int64), np.array(values, dtype=float)
+
+
+def parse_netlist(text: str) -> Netlist:
+    """
+    Build a Netlist from SPICE-style text, see the module docstring for the syntax.
+    """
+    nodes = {}
+
+    def index(name: str) -> int:
+        if name.lower() in GROUND_NAMES:
+            return -1
+        return nodes.setdefault(name, len(nodes))
+
+    elements = {"r": [], "v": [], "i": []}
+    source_names = []
+    for number, line in enumerate(text.splitlines(), 1):
+        line = line.split(";")[0].strip()
+        if not line or line.startswith("*") or line.startswith("."):
+            continue
+        fields = line.split()
+        kind = fields[0][0].lower()
+        if kind not in elements or len(fields) != 4:
+            raise ValueError(f"line {number}: expected 'R|V|I<name> <node> <node> <value>', got {line!r}")
+        value = parse_value(fields[3])
+        if kind == "r" and value <= 0:
+            raise ValueError(f"line {number}: resistance must be positive, got {fields[3]}")
+        elements[kind].append((index(fields[1]), index(fields[2]), value))
+        if kind == "v":
+            source_names.append(fields[0])
+
+    return Netlist(list(nodes), _elements(elements["r"]), _elements(elements["v"]),
+                   _elements(elements["i"]), source_names)
+
+
+def read_netlist(path: str) -> Netlist:
+    """
+    Read a netlist file.
+    """
+    with open(path) as f:
+        return parse_netlist(f.read())
+
+
+def _stamp(rows: list, columns: list, values: list, r, c, v) -> None:
+    # Keep the entries whose row and column are both non-ground.
+    keep = (r >= 0) & (c >= 0)
+    rows.append(r[keep])
+    columns.append(c[keep])
+    values.append(np.broadcast_to(v, keep.shape)[keep])
+
+
+def assemble_mna(netlist: Netlist) -> tuple:
+    """
+    Sparse MNA matrix (CSC) and right-hand side of a netlist.
+
+    Returns:
+    tuple[sparse.csc_matrix, np.ndarray]: Matrix of size nodes + voltage sources and right-hand side.
+    """
+    n = len(netlist.nodes)
+    a, b, resistance = netlist.resistors
+    p, m, voltage = netlist.voltage_sources
+    k = n + np.arange(len(voltage))
+    conductance = 1 / resistance
+
+    rows, columns, values = [], [], []
+    # Each resistor adds +G on its two diagonal entries and -G between its nodes.
+    _stamp(rows, columns, values, a, a, conductance)
+    _stamp(rows, columns, values, b, b, conductance)
+    _stamp(rows, columns, values, a, b, -conductance)
+    _stamp(rows, columns, values, b, a, -conductance)
+    # Each voltage source couples its current to the KCL rows of its nodes and adds its own equation.
+    for node, sign in ((p, 1.0), (m, -1.0)):
+        _stamp(rows, columns, values, node, k, sign)
+        _stamp(rows, columns, values, k, node, sign)
+
+    size = n + len(voltage)
+    matrix = sparse.coo_matrix((np.concatenate(values), (np.concatenate(rows), np.concatenate(columns))),
+                               shape=(size, size)).tocsc()
+
+    rhs = np.zeros(size)
+    plus, minus, current = netlist.current_sources
+    np.add.at(rhs, plus[plus >= 0], -current[plus >= 0])
+    np.add.at(rhs, minus[minus >= 0], current[minus >= 0])
+    rhs[n:] = voltage
+    return matrix, rhs
+
+
+@dataclass
+class MNASolution:
+    """
+    Operating point of a netlist.
+
+    Attributes:
+    netlist (Netlist): The solved circuit.
+    voltages (np.ndarray): Voltage of every non-ground node, in netlist.nodes order.
+    currents (np.ndarray): Current through every voltage source from node+ to node-;
+        a source delivering power has a negative current.
+    """
+    netlist: Netlist
+    voltages: np.ndarray
+    currents: np.ndarray
+
+    def voltage(self, node: str) -> float:
+        """
+        Voltage of a node by name, 0 for ground.
+        """
+        i = self.netlist.node_index(node)
+        return 0.0 if i < 0 else float(self.voltages[i])
+
+    def current(self, source: str) -> float:
+        """
+        Current through a voltage source by name.
+        """
+        return float(self.currents[self.netlist.voltage_source_names.index(source)])
+
+
+def solve_mna(netlist: Netlist) -> MNASolution:
+    """
+    Solve a netlist by sparse LU factorization of its MNA system.
+
+    Raises:
+    RuntimeError: If the matrix is singular, e.g. a node without a DC path to ground.
+    """
+    matrix, rhs = assemble_mna(netlist)
+    n = len(netlist.nodes)
+    solution = splu(matrix).solve(rhs)
+    return MNASolution(netlist, solution[:n], solution[n:])
+
+
+def grid_netlist(rows: int, columns: int, resistance: float = 1.0, voltage: float = 1.0) -> Netlist:
+    """
+    Square mesh of identical resistors, driven by a source at one corner and grounded at the opposite one.
+
+    Handy for testing the solver at 10^5-10^6 nodes without writing the netlist out.
+    """
+    index = np.arange(rows * columns).reshape(rows, columns)
+    a = np.concatenate([index[:, :-1].ravel(), index[:-1, :].ravel()])
+    b = np.concatenate([index[:, 1:].ravel(), index[1:, :].ravel()])
+    resistors = (a, b, np.full(a.size, float(resistance)))
+    # Source from the first node to ground, a resistor from the last node to ground.
+    resistors = tuple(np.append(x, y) for x, y in zip(resistors, (index[-1, -1], -1, float(resistance))))
+    sources = (np.array([0]), np.array([-1]), np.array([float(voltage)]))
+    nodes = [f"n{i}" for i in range(rows * columns)]
+    empty = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0))
+    return Netlist(nodes, resistors, sources, empty, ["V1"])
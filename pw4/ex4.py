@@ -0,0 +1,55 @@
+"""
+4. Using sparse modified nodal analysis
+    a. Describe the circuit of tasks 1-3 as a netlist (ex1.cir).
+    b. Assemble its MNA system as a sparse matrix and solve it with a sparse LU.
+    c. Compare VA, VB, VC, VD with the solution of the Millman equations of task 1.
+    d. Solve a resistor mesh with a million nodes the same way.
+"""
+
+import os
+import time
+
+import numpy as np
+
+from pw4 import grid_netlist, read_netlist, solve_mna
+
+
+class Colors:
+    HEADER = '\033[95m'
+    BLUE = '\033[94m'
+    GREEN = '\033[92m'
+    WARNING = '\033[93m'
+    FAIL = '\033[91m'
+    END = '\033[0m'
+    BOLD = '\033[1m'
+    UNDERLINE = '\033[4m'
+
+# Step 4a/4b: Read the netlist and solve it
+netlist = read_netlist(os.path.join(os.path.dirname(__file__), "ex1.cir"))
+solution = solve_mna(netlist)
+nodes = ["A", "B", "C", "D"]
+solution_mna = np.array([solution.voltage(node) for node in nodes])
+
+# Step 4c: The Millman equations of task 1, written as a linear system in (Va, Vb, Vc, Vd)
+Vcc, R1, R2, R3, R4 = 15, 1000, 2000, 10000, 500
+A = np.array([
+    [1/R1 + 2/R3 + 1/R4, -1/R3, -1/R3, -1/R4],
+    [-1/R3, 1/R2 + 2/R3, 0, -1/R3],
+    [-1/R3, 0, 3/R3, -1/R3],
+    [-1/R4, -1/R3, -1/R3, 1/R1 + 2/R3 + 1/R4],
+])
+B = np.array([Vcc/R1, Vcc/R2, 0, 0])
+solution_millman = np.linalg.solve(A, B)
+
+print(f"\n{Colors.HEADER}{Colors.BOLD}Task 4c: Sparse MNA against the Millman equations{Colors.END}")
+for node, v_mna, v_millman in zip(nodes, solution_mna, solution_millman):
+    print(f"{Colors.GREEN}V{node.lower()} = {v_mna:.4f} V{Colors.END} (Millman: {v_millman:.4f} V)")
+print(f"{Colors.BLUE}Current delivered by VCC: {-solution.current('V1') * 1000:.4f} mA{Colors.END}")
+print(f"{Colors.UNDERLINE}Largest difference:{Colors.END} {np.max(np.abs(solution_mna - solution_millman)):.3e} V")
+
+# Step 4d: A 1000 x 1000 mesh of 1 kOhm resistors
+start = time.perf_counter()
+mesh = solve_mna(grid_netlist(1000, 1000, resistance=1000, voltage=Vcc))
+elapsed = time.perf_counter() - start
+print(f"\n{Colors.HEADER}{Colors.BOLD}Task 4d: 10^6-node resistor mesh{Colors.END}")
+print(f"{Colors.GREEN}Solved in {elapsed:.2f} s, source current {-mesh.currents[0] * 1000:.4f} mA{Colors.END}")
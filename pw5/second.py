@@ -1,5 +1,6 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from plotutils import plot_decimated
 from scipy.integrate import odeint
 
 def gillespie_enzymatic_reaction(k1: float, km1: float, k2: float, 
@@ -120,16 +121,16 @@ deterministic_result = odeint(deterministic_enzymatic_reaction, y0, time_points,
 plt.figure(figsize=(12, 8))
 
 # Gillespie's algorithm results
-plt.plot(gillespie_result["time"], gillespie_result["E"], 'o', label="E (Gillespie)")
-plt.plot(gillespie_result["time"], gillespie_result["S"], 'o', label="S (Gillespie)")
-plt.plot(gillespie_result["time"], gillespie_result["ES"], 'o', label="ES (Gillespie)")
-plt.plot(gillespie_result["time"], gillespie_result["P"], 'o', label="P (Gillespie)")
+plot_decimated(gillespie_result["time"], gillespie_result["E"], 'o', label="E (Gillespie)")
+plot_decimated(gillespie_result["time"], gillespie_result["S"], 'o', label="S (Gillespie)")
+plot_decimated(gillespie_result["time"], gillespie_result["ES"], 'o', label="ES (Gillespie)")
+plot_decimated(gillespie_result["time"], gillespie_result["P"], 'o', label="P (Gillespie)")
 
 # Deterministic results
-plt.plot(time_points, deterministic_result[:, 0], '-', label="E (Deterministic)")
-plt.plot(time_points, deterministic_result[:, 1], '-', label="S (Deterministic)")
-plt.plot(time_points, deterministic_result[:, 2], '-', label="ES (Deterministic)")
-plt.plot(time_points, deterministic_result[:, 3], '-', label="P (Deterministic)")
+plot_decimated(time_points, deterministic_result[:, 0], '-', label="E (Deterministic)")
+plot_decimated(time_points, deterministic_result[:, 1], '-', label="S (Deterministic)")
+plot_decimated(time_points, deterministic_result[:, 2], '-', label="ES (Deterministic)")
+plot_decimated(time_points, deterministic_result[:, 3], '-', label="P (Deterministic)")
 
 plt.xlabel("Time (s)")
 plt.ylabel("Molecule Count")
@@ -0,0 +1,18 @@
+import numpy as np
+
+from pw2 import differentiation_chain, noise_study
+
+
+def test_blocked_percentiles_match_single_block():
+    dt = 0.01
+    t = np.arange(0, 5 + dt, dt)
+    clean = np.vstack([np.sin(t), np.cos(2 * t)])
+    chain = differentiation_chain(dt, 1)
+    reference = chain(clean[None])[0]
+    options = dict(loc=0.01, scale=0.05, realizations=400, seed=0)
+    exact = noise_study(clean, reference, chain, **options)
+    blocked = noise_study(clean, reference, chain, memory_budget=10 << 20, **options)
+    assert exact.exact_percentiles and not blocked.exact_percentiles
+    np.testing.assert_allclose(blocked.rms, exact.rms)
+    for q in (5, 50, 95):
+        assert np.all(np.abs(blocked.percentiles[q] - exact.percentiles[q]) <= 0.1 * exact.std)
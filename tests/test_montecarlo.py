@@ -0,0 +1,13 @@
+import pytest
+
+from pw1 import MonteCarloEngine
+
+
+def test_run_until_stops_within_max_samples():
+    result = MonteCarloEngine(seed=0, block_size=100).run_until(1e-9, max_samples=7)
+    assert result.samples == 7
+
+
+def test_run_until_rejects_empty_budget():
+    with pytest.raises(ValueError):
+        MonteCarloEngine(seed=0).run_until(0.01, max_samples=0)
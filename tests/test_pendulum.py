@@ -0,0 +1,12 @@
+import numpy as np
+
+from pw3 import double_pendulum, grid_initial_conditions, integrate_ensemble, solve_ivp_ensemble
+
+
+def test_integrate_ensemble_passes_method_to_solve_ivp():
+    y0 = grid_initial_conditions(np.radians([30.0, 45.0]), np.radians([0.0, -45.0]))
+    options = dict(args=(1.0,), method="DOP853", rtol=1e-9, atol=1e-11)
+    solution = integrate_ensemble(double_pendulum, (0.0, 2.0), y0, "solve_ivp", **options)
+    reference = solve_ivp_ensemble(double_pendulum, (0.0, 2.0), y0, **options)
+    assert solution.nfev == reference.nfev
+    np.testing.assert_array_equal(solution.y, reference.y)
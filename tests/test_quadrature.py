@@ -0,0 +1,14 @@
+import math
+
+import pytest
+
+from pw1._quadrature import semicircle, simpson, trapezoid
+
+
+@pytest.mark.parametrize("rule", [trapezoid, simpson])
+@pytest.mark.parametrize("tol", [1e-4, 1e-6, 1e-8])
+def test_tolerance_mode_meets_tol_on_semicircle(rule, tol):
+    # The semicircle converges like h**1.5 only, slower than the nominal order of both rules.
+    result = rule(semicircle, -1.0, 1.0, tol=tol)
+    assert abs(result.value - math.pi / 2) <= tol
+    assert result.error <= tol